@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Generation benchmark against the mock OpenAI / Ollama server.
+
+Every scenario runs `formbricks generate` twice in fresh child processes
+sharing one LLM cache: a cold run that calls the model for every prompt and
+a warm run that should be answered from the cache. Each run records wall
+time, LLM calls, cache hit rate, JSON parse time and peak RSS:
+    python -m benchmarks.bench_generate
+    python -m benchmarks.bench_generate --surveys 25 --concurrency 8 --baseline benchmarks/results/old.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import check_regressions, peak_rss_mb, run_child, write_results
+from benchmarks.mock_llm import MockLLM
+
+DATASET_SIZES = (5, 25, 100)
+CONCURRENCY_LEVELS = (1, 4, 16)
+MOCK_DEFAULTS = dict(latency=0.05, tokens_per_second=5000)
+
+
+def child(spec):
+    """Run one generate and print one JSON line of measurements"""
+    import commands.generate as generate
+    from core import llmcache
+
+    os.environ.update(spec['environ'])
+    parse_times = []
+    parse = generate.parse_llm_json
+
+    def timed_parse(content):
+        start = time.perf_counter()
+        try:
+            return parse(content)
+        finally:
+            parse_times.append(time.perf_counter() - start)
+
+    generate.parse_llm_json = timed_parse
+
+    cache_stats = {}
+    close = llmcache.LLMCache.close
+
+    def recording_close(self):
+        cache_stats.update(hits=self.hits, misses=self.misses)
+        close(self)
+
+    llmcache.LLMCache.close = recording_close
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate.generate_command(provider=spec['provider'], model='mock-model',
+                                  output=spec['output'], llm_concurrency=spec['concurrency'],
+                                  rpm=0, cache_path=spec['cache_path'])
+    wall = time.perf_counter() - start
+    lookups = cache_stats.get('hits', 0) + cache_stats.get('misses', 0)
+    print(json.dumps({
+        'wall_seconds': round(wall, 3),
+        'cache_hits': cache_stats.get('hits', 0),
+        'cache_hit_rate': round(cache_stats['hits'] / lookups, 3) if lookups else None,
+        'json_parse_ms': round(sum(parse_times) * 1000, 3),
+        'json_parses': len(parse_times),
+        'peak_rss_mb': peak_rss_mb(),
+    }))
+
+
+def run_scenario(provider, surveys, concurrency, mock_options):
+    name = f"{provider}-{surveys}-surveys-c{concurrency}"
+    runs = {}
+    with tempfile.TemporaryDirectory(prefix=f"bench-generate-{name}-") as workdir:
+        with MockLLM(surveys=surveys, **mock_options) as mock:
+            for phase in ('cold', 'warm'):
+                before = sum(mock.state.calls.values())
+                measured = run_child('benchmarks.bench_generate', {
+                    'provider': provider,
+                    'concurrency': concurrency,
+                    'environ': mock.environ(),
+                    'output': os.path.join(workdir, f"{phase}.jsonl"),
+                    'cache_path': os.path.join(workdir, 'llm_cache.sqlite'),
+                })
+                measured['llm_calls'] = sum(mock.state.calls.values()) - before
+                runs[phase] = measured
+    cold = runs['cold']
+    # Top-level metrics describe the cold run so regressions compare like with like
+    return dict(name=name, provider=provider, surveys=surveys, concurrency=concurrency,
+                mock=mock_options, wall_seconds=cold['wall_seconds'],
+                llm_calls=cold['llm_calls'], runs=runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark formbricks generate against a mock LLM')
+    parser.add_argument('--provider', action='append', choices=['ollama', 'openai'],
+                        help='Provider to benchmark (repeatable, default: every usable one)')
+    parser.add_argument('--surveys', type=int, action='append',
+                        help=f"Surveys per dataset (repeatable, default: {DATASET_SIZES})")
+    parser.add_argument('--concurrency', type=int, action='append',
+                        help=f"LLM concurrency (repeatable, default: {CONCURRENCY_LEVELS})")
+    parser.add_argument('--latency', type=float, default=MOCK_DEFAULTS['latency'],
+                        help='Seconds the mock takes before every reply')
+    parser.add_argument('--tokens-per-second', type=float,
+                        default=MOCK_DEFAULTS['tokens_per_second'],
+                        help='Simulated generation speed of the mock')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/generate-<commit>-<time>.json)')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='Allowed wall time increase versus the baseline before failing')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(json.loads(args.child))
+
+    providers = args.provider or ['ollama', 'openai']
+    if 'openai' in providers and importlib.util.find_spec('openai') is None:
+        print("Skipping openai: the openai package is not installed")
+        providers = [p for p in providers if p != 'openai']
+
+    mock_options = dict(latency=args.latency, tokens_per_second=args.tokens_per_second)
+    results = []
+    for provider in providers:
+        for surveys in args.surveys or DATASET_SIZES:
+            for concurrency in args.concurrency or CONCURRENCY_LEVELS:
+                result = run_scenario(provider, surveys, concurrency, mock_options)
+                results.append(result)
+                cold, warm = result['runs']['cold'], result['runs']['warm']
+                print(f"{result['name']:>28}: cold {cold['wall_seconds']:>6.2f}s "
+                      f"{cold['llm_calls']:>4} calls, parse {cold['json_parse_ms']}ms, "
+                      f"peak RSS {cold['peak_rss_mb']}MB | warm {warm['wall_seconds']:>6.2f}s "
+                      f"{warm['llm_calls']} calls, hit rate {warm['cache_hit_rate']:.0%}")
+
+    print(f"Results written to {write_results('generate', results, args.output)}")
+    if args.baseline:
+        failures = check_regressions(results, args.baseline, 'wall_seconds', args.tolerance,
+                                     higher_is_better=False)
+        for failure in failures:
+            print(f"Regression: {failure}")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""CLI startup budget: import time and heavy imports per invocation.
+
+Runs each invocation under `python -X importtime` in a fresh interpreter.
+Invocations other than --help really dispatch their command, with
+subprocess.run stubbed out so no docker call is made, which keeps the lazy
+command loading under test. It fails when an invocation imports a module it
+must not pay for, or when its total import time exceeds the budget:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --budget-ms 80 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import REPO_ROOT, write_results
+
+HEAVY = ('openai', 'requests', 'urllib3', 'numpy', 'sqlite3', 'zstandard', 'orjson')
+
+# Invocation -> heavy modules it is allowed to import
+INVOCATIONS = {
+    '--help': (),
+    'formbricks --help': (),
+    'formbricks up --help': (),
+    'formbricks down --help': (),
+    'formbricks generate --help': (),
+    'formbricks seed --help': (),
+    'formbricks pipeline --help': (),
+    'formbricks purge --help': (),
+    'formbricks down': (),
+}
+
+# Runs main.py in place with subprocess.run answering success without running anything
+STUB = ("import subprocess, sys; "
+        "subprocess.run = lambda args, **kwargs: subprocess.CompletedProcess(args, 0); "
+        "sys.argv[0] = 'main.py'; import main; main.main()")
+
+
+def measure(argv):
+    """Return (total import ms, imported module names, wall ms) for one invocation"""
+    entry = ['main.py'] if '--help' in argv else ['-c', STUB]
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + entry + argv, cwd=REPO_ROOT,
+                            capture_output=True, text=True, env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+    wall = (time.perf_counter() - start) * 1000
+    total, modules = 0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        modules.add(name.strip())
+    return total / 1000, modules, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check CLI startup import cost')
+    parser.add_argument('--budget-ms', type=float, default=100.0,
+                        help='Maximum median import time per invocation')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per invocation; the median is used')
+    parser.add_argument('--output', help='Also write results to this file')
+    args = parser.parse_args()
+
+    failures, results = [], []
+    for invocation, allowed in INVOCATIONS.items():
+        runs = [measure(invocation.split()) for _ in range(max(1, args.repeat))]
+        import_ms = statistics.median(r[0] for r in runs)
+        wall_ms = statistics.median(r[2] for r in runs)
+        heavy = sorted(m for m in runs[0][1] if m in HEAVY and m not in allowed)
+        results.append(dict(name=invocation, import_ms=round(import_ms, 1), wall_ms=round(wall_ms, 1),
+                            heavy_imports=heavy))
+        print(f"{invocation:>28}: imports {import_ms:>6.1f}ms  wall {wall_ms:>6.1f}ms"
+              + (f"  heavy: {', '.join(heavy)}" if heavy else ''))
+        if heavy:
+            failures.append(f"{invocation} imports {', '.join(heavy)}")
+        if import_ms > args.budget_ms:
+            failures.append(f"{invocation} spends {import_ms:.1f}ms importing (budget {args.budget_ms:g}ms)")
+
+    if args.output:
+        write_results('import', results, args.output)
+    for failure in failures:
+        print(f"Over budget: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Seeding throughput benchmark against the mock Formbricks server.
+
+Each scenario seeds a fixed synthetic dataset through seed_records in a
+fresh child process and records requests/sec, client-side latency
+percentiles, peak RSS and wall time:
+    python -m benchmarks.bench_seed
+    python -m benchmarks.bench_seed --scenario small --baseline benchmarks/results/old.json
+    python -m benchmarks.bench_seed --engine async --concurrency 256
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.common import (check_regressions, latency_summary, peak_rss_mb, run_child,
+                               write_results)
+from benchmarks.mock_formbricks import MockFormbricks
+
+SCENARIOS = {
+    'small': dict(surveys=20, users=20, responses_per_survey=50, latency=0.005),
+    'medium': dict(surveys=100, users=100, responses_per_survey=200, latency=0.01),
+    'high-latency': dict(surveys=20, users=20, responses_per_survey=100, latency=0.05,
+                         jitter=0.02),
+    'faulty': dict(surveys=50, users=50, responses_per_survey=100, latency=0.01,
+                   error_rate=0.02, throttle_rate=0.05, lost_reply_rate=0.01),
+}
+
+SEED_DEFAULTS = dict(concurrency=16, rate=0, batch_size=50)
+
+
+def child(spec):
+    """Seed the prepared dataset and print one JSON line of measurements"""
+    from core import transport as transport_module
+    from commands.seed import load_config, seed_records
+    from core.datafile import read_records
+
+    latencies = []
+    original = transport_module.Transport.request
+
+    def timed_request(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    transport_module.Transport.request = timed_request
+    if spec['seed'].get('engine') == 'async':
+        from core import async_api
+        original_async = async_api.AsyncTransport.request
+
+        async def timed_async_request(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await original_async(self, *args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+        async_api.AsyncTransport.request = timed_async_request
+    workdir = spec['workdir']
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        # seed_records rather than seed_command, which exits non-zero when items fail
+        stats = seed_records(load_config(os.path.join(workdir, 'config.json')),
+                             read_records(os.path.join(workdir, 'data.jsonl')),
+                             journal_path=os.path.join(workdir, 'journal.jsonl'),
+                             registry_path=os.path.join(workdir, 'registry.json'),
+                             **spec['seed'])
+    wall = time.perf_counter() - start
+    print(json.dumps({
+        'wall_seconds': round(wall, 3),
+        'requests': stats.requests,
+        'requests_per_second': round(stats.requests / wall, 1) if wall else None,
+        'latency': latency_summary(latencies),
+        'peak_rss_mb': peak_rss_mb(),
+        'created': stats.counts,
+        'failed': stats.failures,
+    }))
+
+
+def run_scenario(name, spec, seed_options):
+    from core.datafile import RecordWriter
+    from core.synthetic import synthetic_records
+
+    faults = {k: spec[k] for k in ('latency', 'jitter', 'error_rate', 'throttle_rate',
+                                   'lost_reply_rate') if k in spec}
+    with tempfile.TemporaryDirectory(prefix=f"bench-seed-{name}-") as workdir:
+        with RecordWriter(os.path.join(workdir, 'data.jsonl')) as writer:
+            for record in synthetic_records(seed=1, surveys=spec['surveys'], users=spec['users'],
+                                            responses_per_survey=spec['responses_per_survey']):
+                writer.write(record)
+        with MockFormbricks(**faults) as mock:
+            with open(os.path.join(workdir, 'config.json'), 'w') as f:
+                json.dump(mock.config(), f)
+            measured = run_child('benchmarks.bench_seed', {'workdir': workdir, 'seed': seed_options})
+            server_requests = dict(mock.state.requests)
+            stored = dict(surveys=len(mock.state.surveys), responses=len(mock.state.responses),
+                          users=len(mock.state.users))
+    return dict(name=name, dataset=spec, seed_options=seed_options, server_requests=server_requests,
+                stored=stored, **measured)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark formbricks seed against a mock server')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Scenario to run (repeatable, default: all)')
+    parser.add_argument('--concurrency', type=int, default=SEED_DEFAULTS['concurrency'])
+    parser.add_argument('--batch-size', type=int, default=SEED_DEFAULTS['batch_size'])
+    parser.add_argument('--rate', type=float, default=SEED_DEFAULTS['rate'])
+    parser.add_argument('--engine', choices=['threads', 'async'], default='threads')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/seed-<commit>-<time>.json)')
+    parser.add_argument('--baseline', help='Earlier results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help='Allowed requests/sec drop versus the baseline before failing')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(json.loads(args.child))
+
+    seed_options = dict(concurrency=args.concurrency, batch_size=args.batch_size, rate=args.rate,
+                        engine=args.engine)
+    results = []
+    for name in args.scenario or sorted(SCENARIOS):
+        result = run_scenario(name, SCENARIOS[name], seed_options)
+        results.append(result)
+        latency = result['latency']
+        print(f"{name:>14}: {result['requests']:>7} requests in {result['wall_seconds']:>7.2f}s "
+              f"{result['requests_per_second']:>8.1f} req/s  p50 {latency['p50_ms']}ms "
+              f"p95 {latency['p95_ms']}ms p99 {latency['p99_ms']}ms  peak RSS {result['peak_rss_mb']}MB")
+
+    print(f"Results written to {write_results('seed', results, args.output)}")
+    if args.baseline:
+        failures = check_regressions(results, args.baseline, 'requests_per_second', args.tolerance)
+        for failure in failures:
+            print(f"Regression: {failure}")
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
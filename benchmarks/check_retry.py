@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Retry parity check: the threaded and async engines must treat failures alike.
+
+Sends one survey create per failure mode through FormbricksAPI and
+AsyncFormbricksAPI and compares whether the transport retried the POST and
+whether the engine would see the failure as unsent or as outcome-unknown.
+It fails when the two clients disagree on any failure mode:
+    python -m benchmarks.check_retry
+"""
+import asyncio
+import random
+import socket
+import sys
+
+from benchmarks.mock_formbricks import API_KEY, MockFormbricks
+from core.api import FormbricksAPI
+from core.async_api import AsyncFormbricksAPI, AsyncTransport
+from core.retry import RetryPolicy, outcome_unknown, was_unsent
+from core.synthetic import make_survey
+from core.transport import Transport
+
+# Failure mode -> mock server options; None means no server is listening at all
+CASES = {
+    'refused': None,
+    'throttled': dict(throttle_rate=1.0),
+    'server error': dict(error_rate=1.0),
+    'lost reply': dict(lost_reply_rate=1.0),
+    'read timeout': dict(latency=1.0),
+}
+TIMEOUT = 0.3
+
+
+def closed_port_url():
+    """URL of a local port nothing listens on, so connecting is refused"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def create_threaded(base_url, survey, policy):
+    transport = Transport(base_url, api_key=API_KEY, timeout=TIMEOUT, retry_policy=policy)
+    try:
+        FormbricksAPI(base_url, API_KEY, transport=transport).create_survey(survey)
+    except Exception as e:
+        return e
+    finally:
+        transport.close()
+    return None
+
+
+def create_async(base_url, survey, policy):
+    return asyncio.run(_create_async(base_url, survey, policy))
+
+
+async def _create_async(base_url, survey, policy):
+    transport = AsyncTransport(base_url, api_key=API_KEY, timeout=TIMEOUT, retry_policy=policy)
+    try:
+        await AsyncFormbricksAPI(base_url, API_KEY, transport=transport).create_survey(survey)
+    except Exception as e:
+        return e
+    finally:
+        await transport.close()
+    return None
+
+
+def run_case(options, create):
+    """(retried, unsent, outcome unknown) for one survey create under `options`"""
+    survey = make_survey(random.Random(1), 0)
+    policy = RetryPolicy(attempts=2, base_delay=0.0)
+    if options is None:
+        error = create(closed_port_url(), survey, policy)
+    else:
+        with MockFormbricks(**options) as mock:
+            error = create(mock.base_url, survey, policy)
+    if error is None:
+        return policy.budget.used > 0, None, None
+    return policy.budget.used > 0, was_unsent(error), outcome_unknown(error)
+
+
+def main():
+    failures = []
+    print(f"{'Failure':>14}  {'threads':<28} async")
+    for name, options in CASES.items():
+        threaded = run_case(options, create_threaded)
+        async_ = run_case(options, create_async)
+        print(f"{name:>14}  {str(threaded):<28} {async_}")
+        if threaded != async_:
+            failures.append(name)
+    print("(retried, unsent, outcome unknown)")
+    for name in failures:
+        print(f"Mismatch: the engines classify '{name}' differently")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Helpers shared by the benchmark suites"""
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of an unsorted list, in the samples' unit"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples):
+    return {
+        'count': len(samples),
+        'p50_ms': _ms(percentile(samples, 50)),
+        'p95_ms': _ms(percentile(samples, 95)),
+        'p99_ms': _ms(percentile(samples, 99)),
+    }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_child(module, spec):
+    """Run one scenario in a fresh interpreter so peak RSS is per scenario"""
+    result = subprocess.run([sys.executable, '-m', module, '--child', json.dumps(spec)],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Scenario failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def write_results(suite, scenarios, output=None):
+    """Write results with enough context to compare them across commits"""
+    results = {
+        'suite': suite,
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scenarios': scenarios,
+    }
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{suite}-{results['commit'] or 'local'}-{int(time.time())}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    return output
+
+
+def check_regressions(results, baseline_path, metric, tolerance, higher_is_better=True):
+    """Compare `metric` per scenario against a baseline results file; return failures"""
+    with open(baseline_path) as f:
+        baseline = {s['name']: s for s in json.load(f)['scenarios']}
+    failures = []
+    for scenario in results:
+        before = baseline.get(scenario['name'], {}).get(metric)
+        after = scenario.get(metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            failures.append(f"{scenario['name']}: {metric} {before} -> {after} ({change:+.0%})")
+    return failures
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""In-process mock of the Formbricks Management and Client API endpoints the seeder uses.
+
+Latency, 5xx error rate and 429 throttling are configurable so seeding
+behaviour can be measured fully offline. `lost_reply_rate` makes a POST
+succeed but answer 502, as a dropped reply would. Like the real Formbricks
+API, the mock ignores Idempotency-Key unless `idempotent_replay` is set, in
+which case POSTs repeated with the same key get the first reply back.
+Run standalone with:
+    python -m benchmarks.mock_formbricks --port 3999 --latency 0.02
+"""
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_KEY = 'mock-api-key'
+ENVIRONMENT_ID = 'mock-environment'
+
+SURVEY_PATH = re.compile(r'^/api/v1/management/surveys/([^/?]+)$')
+RESPONSES_PATH = re.compile(r'^/api/v1/client/([^/]+)/responses$')
+
+
+class MockState:
+    """Everything the mock server has stored, plus request counters"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 lost_reply_rate=0.0, idempotent_replay=False, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.lost_reply_rate = lost_reply_rate
+        self.idempotent_replay = idempotent_replay
+        self.replies = {}
+        self.surveys = {}
+        self.responses = {}
+        self.users = {}
+        self.requests = {}
+        # Re-entrant: handlers reply (and record idempotent replies) while holding it
+        self.lock = threading.RLock()
+        self._random = random.Random(seed)
+
+    def count(self, route):
+        with self.lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def fault(self):
+        """Decide whether this request fails: returns None, 429 or 500"""
+        with self.lock:
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+    def lose_reply(self):
+        if not self.lost_reply_rate:
+            return False
+        with self.lock:
+            return self._random.random() < self.lost_reply_rate
+
+    def delay(self):
+        if self.latency or self.jitter:
+            with self.lock:
+                extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+            time.sleep(self.latency + extra)
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        key = getattr(self, '_reply_key', None)
+        if status < 300 and self.command == 'POST':
+            if key:
+                self._reply_key = None
+                with self.state.lock:
+                    self.state.replies[key] = (status, body, headers)
+            if self.state.lose_reply():
+                self.state.count('lost_reply')
+                status, body, headers = 502, {'error': 'Bad gateway'}, None
+        payload = json.dumps(body if body is not None else {}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        # Headers and body in one write, so Nagle never stalls the response
+        self._headers_buffer.append(b'\r\n' + payload)
+        self.wfile.write(b''.join(self._headers_buffer))
+        self._headers_buffer = []
+
+    def _body(self):
+        raw = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        return json.loads(raw) if raw else None
+
+    def _dispatch(self, method):
+        # One handler serves every request on a keep-alive connection; reset per request
+        self._reply_key = None
+        # Always drain the body, or it would be parsed as the next request
+        body = self._body() if method in ('POST', 'PUT') else None
+        key = None
+        if method == 'POST' and self.state.idempotent_replay:
+            key = self.headers.get('Idempotency-Key')
+        if key:
+            with self.state.lock:
+                reply = self.state.replies.get(key)
+            if reply is not None:
+                self.state.count('idempotent_replay')
+                return self._send(*reply)
+        self._reply_key = key
+        self._route(method, body)
+
+    def _route(self, method, body):
+        state = self.state
+        path = self.path.split('?', 1)[0]
+        if path == '/api/health':
+            state.count('health')
+            return self._send(200, {'status': 'ok'})
+
+        state.delay()
+        fault = state.fault()
+        if fault == 429:
+            state.count('throttled')
+            return self._send(429, {'error': 'Too many requests'}, {'Retry-After': '1'})
+        if fault == 500:
+            state.count('error')
+            return self._send(500, {'error': 'Injected failure'})
+
+        match = RESPONSES_PATH.match(path)
+        if match and method == 'POST':
+            state.count('create_response')
+            survey_id = (body or {}).get('surveyId')
+            if match.group(1) != ENVIRONMENT_ID or survey_id not in state.surveys:
+                return self._send(404, {'error': 'Survey not found'})
+            response_id = uuid.uuid4().hex
+            with state.lock:
+                state.responses[response_id] = body
+            return self._send(200, {'data': {'id': response_id}})
+
+        if self.headers.get('x-api-key') != API_KEY:
+            state.count('unauthorized')
+            return self._send(401, {'error': 'Not authenticated'})
+
+        if path == '/api/v1/management/surveys':
+            if method == 'GET':
+                state.count('list_surveys')
+                with state.lock:
+                    return self._send(200, {'data': list(state.surveys.values())})
+            state.count('create_survey')
+            survey = dict(body, id=uuid.uuid4().hex,
+                          questions=[dict(q, id=uuid.uuid4().hex[:12]) for q in body['questions']])
+            with state.lock:
+                state.surveys[survey['id']] = survey
+            return self._send(200, {'data': survey})
+
+        match = SURVEY_PATH.match(path)
+        if match:
+            survey_id = match.group(1)
+            state.count(f"{method.lower()}_survey")
+            with state.lock:
+                survey = state.surveys.get(survey_id)
+                if survey is None:
+                    return self._send(404, {'error': 'Survey not found'})
+                if method == 'DELETE':
+                    del state.surveys[survey_id]
+                    doomed = [rid for rid, r in state.responses.items() if r.get('surveyId') == survey_id]
+                    for rid in doomed:
+                        del state.responses[rid]
+                elif method == 'PUT':
+                    survey.update(body, id=survey_id)
+                    if 'questions' in body:
+                        survey['questions'] = [dict(q, id=q.get('id') or uuid.uuid4().hex[:12])
+                                               for q in body['questions']]
+            return self._send(200, {'data': survey})
+
+        if path == '/api/v1/management/users':
+            if method == 'GET':
+                state.count('list_users')
+                with state.lock:
+                    return self._send(200, {'data': list(state.users.values())})
+            state.count('invite_user')
+            with state.lock:
+                if body['email'] in state.users:
+                    return self._send(409, {'error': 'User already exists'})
+                state.users[body['email']] = dict(body, id=uuid.uuid4().hex)
+                return self._send(201, {'data': state.users[body['email']]})
+
+        state.count('not_found')
+        return self._send(404, {'error': 'Not found'})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class MockServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with a listen backlog deep enough for high-concurrency clients"""
+    # The default backlog of 5 makes connection bursts fail or stall before any handler runs
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class MockFormbricks:
+    """Run the mock server on a background thread; use as a context manager"""
+
+    def __init__(self, port=0, **options):
+        self.state = MockState(**options)
+        handler = type('BoundMockHandler', (MockHandler,), {'state': self.state})
+        self.server = MockServer(('127.0.0.1', port), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name='mock-formbricks',
+                                       daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def config(self):
+        """A seeder config.json pointing at this server"""
+        return {'base_url': self.base_url, 'api_key': API_KEY, 'environment_id': ENVIRONMENT_ID}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Formbricks API server')
+    parser.add_argument('--port', type=int, default=3999)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every request')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency, up to this many seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--lost-reply-rate', type=float, default=0.0,
+                        help='Fraction of successful POSTs whose reply is replaced by a 502')
+    parser.add_argument('--idempotent-replay', action='store_true',
+                        help='Answer repeated POSTs with the same Idempotency-Key from a cache '
+                             '(the real Formbricks API does not)')
+    args = parser.parse_args()
+
+    with MockFormbricks(args.port, latency=args.latency, jitter=args.jitter,
+                        error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                        lost_reply_rate=args.lost_reply_rate,
+                        idempotent_replay=args.idempotent_replay) as mock:
+        print(f"Mock Formbricks at {mock.base_url}")
+        print(json.dumps(mock.config(), indent=2))
+        try:
+            mock.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""In-process stand-in for the OpenAI chat-completions and Ollama generate endpoints.
+
+Replies are valid JSON for the survey, user and response prompts in
+commands.generate, derived deterministically from the prompt text. Each
+reply takes `latency` seconds plus its completion tokens divided by
+`tokens_per_second`. Run standalone with:
+    python -m benchmarks.mock_llm --port 11999 --latency 0.2
+then point the CLI at it with OLLAMA_HOST / OPENAI_BASE_URL.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from benchmarks.mock_formbricks import MockServer
+from core.synthetic import _answer_sampler, make_survey, make_user
+
+
+def _rng(prompt):
+    return random.Random(hashlib.sha256(prompt.encode('utf-8')).hexdigest())
+
+
+def _tokens(text):
+    # Roughly four characters per token, as for English text
+    return max(1, len(text) // 4)
+
+
+def reply_for(prompt, surveys=5, users=10):
+    """The JSON document a well-behaved model would return for `prompt`"""
+    rng = _rng(prompt)
+    if '"surveys"' in prompt:
+        built = []
+        for index in range(surveys):
+            survey = make_survey(rng, index)
+            del survey['key']
+            built.append(survey)
+        return {'surveys': built}
+    if '"users"' in prompt:
+        return {'users': [make_user(rng, index) for index in range(users)]}
+    try:
+        questions = json.loads(prompt.split('Questions: ', 1)[1].split('\n\nReturn ONLY', 1)[0])
+    except (IndexError, ValueError):
+        questions = []
+    return {'responses': [{'questionId': 'will be filled by system',
+                           'value': _answer_sampler(q)(rng)} for q in questions]}
+
+
+class MockLLMState:
+    def __init__(self, latency=0.0, tokens_per_second=0.0, surveys=5, users=10):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.surveys = surveys
+        self.users = users
+        self.calls = {}
+        self.tokens = 0
+        self.lock = threading.Lock()
+
+    def complete(self, route, prompt):
+        """Return (content, prompt_tokens, completion_tokens) after the simulated delay"""
+        content = json.dumps(reply_for(prompt, self.surveys, self.users))
+        prompt_tokens, completion_tokens = _tokens(prompt), _tokens(content)
+        with self.lock:
+            self.calls[route] = self.calls.get(route, 0) + 1
+            self.tokens += prompt_tokens + completion_tokens
+        delay = self.latency
+        if self.tokens_per_second:
+            delay += completion_tokens / self.tokens_per_second
+        if delay:
+            time.sleep(delay)
+        return content, prompt_tokens, completion_tokens
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self._headers_buffer.append(b'\r\n' + payload)
+        self.wfile.write(b''.join(self._headers_buffer))
+        self._headers_buffer = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        path = self.path.split('?', 1)[0].rstrip('/')
+        if path.endswith('/chat/completions'):
+            prompt = body['messages'][-1]['content']
+            content, prompt_tokens, completion_tokens = self.state.complete('openai', prompt)
+            return self._send(200, {
+                'id': 'chatcmpl-mock',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': body.get('model'),
+                'choices': [{'index': 0, 'finish_reason': 'stop',
+                             'message': {'role': 'assistant', 'content': content}}],
+                'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                          'total_tokens': prompt_tokens + completion_tokens},
+            })
+        if path == '/api/generate':
+            content, prompt_tokens, completion_tokens = self.state.complete('ollama', body['prompt'])
+            return self._send(200, {
+                'model': body.get('model'),
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'response': content,
+                'done': True,
+                'prompt_eval_count': prompt_tokens,
+                'eval_count': completion_tokens,
+            })
+        self._send(404, {'error': 'Not found'})
+
+
+class MockLLM:
+    """Run the mock LLM server on a background thread; use as a context manager"""
+
+    def __init__(self, port=0, **options):
+        self.state = MockLLMState(**options)
+        handler = type('BoundMockLLMHandler', (MockLLMHandler,), {'state': self.state})
+        self.server = MockServer(('127.0.0.1', port), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name='mock-llm',
+                                       daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def environ(self):
+        """Environment variables pointing both providers at this server"""
+        return {'OLLAMA_HOST': self.base_url, 'OPENAI_BASE_URL': f"{self.base_url}/v1",
+                'OPENAI_API_KEY': 'mock-openai-key'}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock OpenAI / Ollama server')
+    parser.add_argument('--port', type=int, default=11999)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every call')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0,
+                        help='Simulated generation speed (0 = instant)')
+    parser.add_argument('--surveys', type=int, default=5, help='Surveys returned by the survey prompt')
+    parser.add_argument('--users', type=int, default=10, help='Users returned by the user prompt')
+    args = parser.parse_args()
+
+    with MockLLM(args.port, latency=args.latency, tokens_per_second=args.tokens_per_second,
+                 surveys=args.surveys, users=args.users) as mock:
+        print(f"Mock LLM at {mock.base_url}")
+        for name, value in mock.environ().items():
+            print(f"export {name}={value}")
+        try:
+            mock.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,14 @@
 import subprocess
 import sys
 
+from core import metrics
+
 def down_command():
     """Stop and remove Formbricks containers"""
     print("Stopping Formbricks...")
     try:
-        subprocess.run(['docker', 'compose', 'down', '-v'], check=True, cwd='.')
+        with metrics.timer('docker_shutdown'):
+            subprocess.run(['docker', 'compose', 'down', '-v'], check=True, cwd='.')
         print("Formbricks stopped")
     except subprocess.CalledProcessError as e:
         print(f"Error: {e}")
@@ -1,24 +1,348 @@
 #!/usr/bin/env python3
 import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def generate_command(provider='openai', model='gpt-4o-mini'):
+import requests
+
+from core import metrics
+from core.budget import BudgetExceeded, LLMBudget
+from core.datafile import RecordWriter
+from core.llmcache import DEFAULT_CACHE, LLMCache, cache_key
+from core.retry import RETRYABLE_STATUS, RetryBudget, RetryPolicy, classify_http, retry_after
+from core.shards import generate_sharded
+from core.synthetic import synthetic_records
+
+DEFAULT_OUTPUT = 'data/generated_data.jsonl'
+OPENAI_TEMPERATURE = 0.8
+DEFAULT_OLLAMA_HOST = 'http://localhost:11434'
+
+SURVEY_GENERATION_PROMPT = """Generate 5 unique, realistic surveys for a product feedback platform. Each survey should be well-designed with a clear purpose.
+
+Return ONLY valid JSON (no markdown, no explanation) in this exact format:
+{
+  "surveys": [
+    {
+      "name": "Survey Name",
+      "type": "app|website|link",
+      "description": "Brief description",
+      "questions": [
+        {
+          "type": "openText|multipleChoiceSingle|multipleChoiceMulti|nps|rating|cta",
+          "headline": "Question text",
+          "required": true|false,
+          "choices": ["Option 1", "Option 2"] (only for multiple choice),
+          "range": 5|7|10 (only for rating),
+          "dismissButtonLabel": "Skip" (optional),
+          "buttonLabel": "Next" (optional)
+        }
+      ]
+    }
+  ]
+}
+
+Survey types: "app" (in-app), "website" (website widget), "link" (shareable link)
+Question types available: openText, multipleChoiceSingle, multipleChoiceMulti, nps, rating, cta
+
+Requirements:
+- Create 5 diverse surveys (product feedback, NPS, feature request, user onboarding, customer satisfaction)
+- Each survey should have 3-5 questions
+- Mix different question types appropriately
+- Make questions realistic and professionally worded
+- Include relevant choice options for multiple choice questions
+- Use appropriate ranges for rating questions (5, 7, or 10)"""
+
+USER_GENERATION_PROMPT = """Generate 10 unique, realistic users for a SaaS platform team.
+
+Return ONLY valid JSON (no markdown, no explanation) in this exact format:
+{
+  "users": [
+    {
+      "name": "Full Name",
+      "email": "email@example.com",
+      "role": "Manager|Owner"
+    }
+  ]
+}
+
+Requirements:
+- Create 10 users with realistic names
+- Use professional email addresses
+- Mix of Manager and Owner roles (at least 2 Owners, rest Managers)
+- Diverse, realistic names
+- Professional email format (firstname.lastname@company.com)"""
+
+RESPONSE_GENERATION_PROMPT = """Generate realistic survey responses for the following survey:
+
+Survey: {survey_name}
+Questions: {questions}
+
+Return ONLY valid JSON (no markdown, no explanation) with realistic, thoughtful responses:
+{{
+  "responses": [
+    {{
+      "questionId": "will be filled by system",
+      "value": "response value - text for openText, choice label for multiple choice, number 0-10 for nps, number for rating"
+    }}
+  ]
+}}
+
+Requirements:
+- Provide thoughtful, realistic responses
+- For NPS: use numbers 0-10
+- For ratings: use appropriate numbers based on the question
+- For multiple choice: use exact choice labels
+- For open text: write 1-3 realistic sentences
+- Make responses coherent and professional"""
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _client(provider):
+    """One thread-safe, connection-pooled client per provider"""
+    with _clients_lock:
+        if provider not in _clients:
+            if provider == 'openai':
+                from openai import OpenAI
+                # Retries are left to core.retry so every provider follows one policy
+                _clients[provider] = OpenAI(api_key=os.getenv('OPENAI_API_KEY'),
+                                            base_url=os.getenv('OPENAI_BASE_URL') or None,
+                                            max_retries=0)
+            else:
+                _clients[provider] = requests.Session()
+        return _clients[provider]
+
+
+def ollama_url(path='/api/generate'):
+    """Ollama endpoint, honouring OLLAMA_HOST like the ollama CLI does"""
+    host = os.getenv('OLLAMA_HOST') or DEFAULT_OLLAMA_HOST
+    if '://' not in host:
+        host = f"http://{host}"
+    return host.rstrip('/') + path
+
+
+def parse_llm_json(content):
+    """Parse an LLM reply, tolerating a surrounding markdown code fence"""
+    with metrics.timer('json_parse'):
+        content = content.strip()
+        if content.startswith('```'):
+            lines = content.split('\n')
+            content = '\n'.join(lines[1:-1]) if len(lines) > 2 else content
+        return json.loads(content)
+
+
+class LLMError(Exception):
+    """Raised when an LLM provider call fails for good"""
+
+
+def _classify_openai(error):
+    """(retryable, retry_after) for an exception raised by the OpenAI SDK"""
+    status = getattr(error, 'status_code', None)
+    if status is not None:
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        return status in RETRYABLE_STATUS, retry_after(headers)
+    # Checked by name so the SDK is only imported when it is used
+    return type(error).__name__ in ('APITimeoutError', 'APIConnectionError'), None
+
+
+def _classify_ollama(error):
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return classify_http(error.response)
+    return classify_http(error=error)
+
+
+def generate_with_openai(prompt, model='gpt-4o-mini', budget=None, retry_policy=None):
+    """Generate data using OpenAI API"""
+    if not os.getenv('OPENAI_API_KEY'):
+        raise LLMError("OPENAI_API_KEY environment variable not set")
+
+    def call():
+        if budget is not None:
+            budget.acquire()
+        with metrics.timer('llm_call', provider='openai'):
+            response = _client('openai').chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are a data generation assistant. Always return valid JSON only, no markdown formatting, no explanations."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=OPENAI_TEMPERATURE,
+                response_format={"type": "json_object"}
+            )
+        if budget is not None:
+            budget.spend(response.usage.total_tokens if response.usage else 0)
+        return response.choices[0].message.content
+
+    try:
+        content = (retry_policy or RetryPolicy(attempts=1)).call(call, _classify_openai, stage='llm')
+        return parse_llm_json(content)
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        raise LLMError(f"Error calling OpenAI API: {e}") from e
+
+
+def generate_with_ollama(prompt, model='llama2', budget=None, retry_policy=None):
+    """Generate data using Ollama (local LLM)"""
+    def call():
+        if budget is not None:
+            budget.acquire()
+        with metrics.timer('llm_call', provider='ollama'):
+            response = _client('ollama').post(
+                ollama_url(),
+                json={'model': model, 'prompt': prompt, 'stream': False, 'format': 'json'},
+                timeout=120
+            )
+        response.raise_for_status()
+        result = response.json()
+        if budget is not None:
+            budget.spend(result.get('prompt_eval_count', 0) + result.get('eval_count', 0))
+        return result.get('response', '{}')
+
+    try:
+        content = (retry_policy or RetryPolicy(attempts=1)).call(call, _classify_ollama, stage='llm')
+        return parse_llm_json(content)
+    except BudgetExceeded:
+        raise
+    except Exception as e:
+        raise LLMError(f"Error calling Ollama API: {e}. "
+                       f"Make sure Ollama is running at {ollama_url('')}: ollama serve") from e
+
+
+PROVIDERS = {
+    'openai': (generate_with_openai, OPENAI_TEMPERATURE),
+    'ollama': (generate_with_ollama, None),
+}
+
+
+def _generate(provider, prompt, model, budget, cache, retry_policy=None):
+    """Call the provider, answering from the cache when the same prompt was seen before"""
+    generate_func, temperature = PROVIDERS[provider]
+    if cache is None:
+        return generate_func(prompt, model, budget, retry_policy)
+    key = cache_key(provider, model, prompt, temperature)
+    result = cache.get(key)
+    metrics.count('llm_cache', result='miss' if result is None else 'hit')
+    if result is None:
+        result = generate_func(prompt, model, budget, retry_policy)
+        cache.put(key, result)
+    return result
+
+
+def _response_prompt(survey):
+    questions_text = json.dumps([
+        {
+            'headline': q['headline'],
+            'type': q['type'],
+            'choices': q.get('choices', []),
+            'range': q.get('range')
+        }
+        for q in survey['questions']
+    ], indent=2)
+    return RESPONSE_GENERATION_PROMPT.format(survey_name=survey['name'], questions=questions_text)
+
+
+def llm_records(provider='openai', model='gpt-4o-mini', llm_concurrency=4, rpm=None,
+                token_budget=0, use_cache=True, refresh=False, cache_path=DEFAULT_CACHE,
+                llm_retries=4):
+    """Yield survey, user and response records as the LLM produces them.
+
+    The survey and user prompts run side by side, then the per-survey
+    response prompts fan out over `llm_concurrency` threads. Records are
+    yielded in completion order. Results are cached on disk unless
+    `use_cache` is off; `refresh` regenerates and overwrites cached entries.
+    Transient provider errors are retried up to `llm_retries` attempts per
+    call; a survey or user prompt that still fails raises LLMError, while a
+    failed response prompt only skips that survey's responses.
+    """
+    budget = LLMBudget(provider, rpm=rpm, max_tokens=token_budget)
+    cache = LLMCache(cache_path, refresh=refresh) if use_cache else None
+    policy = RetryPolicy(attempts=llm_retries, base_delay=1.0, max_delay=30.0,
+                         budget=RetryBudget(max(10, llm_retries * 10)))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, llm_concurrency)) as pool:
+            print("Generating surveys and users...")
+            users_future = pool.submit(_generate, provider, USER_GENERATION_PROMPT, model, budget,
+                                       cache, policy)
+            surveys = _generate(provider, SURVEY_GENERATION_PROMPT, model, budget, cache,
+                                policy).get('surveys', [])
+            for i, survey in enumerate(surveys):
+                survey['key'] = f"survey-{i}"
+                yield dict(survey, kind='survey')
+
+            print(f"Generating survey responses ({llm_concurrency} at a time)...")
+            futures = {
+                pool.submit(_generate, provider, _response_prompt(survey), model, budget, cache,
+                            policy): survey
+                for survey in surveys
+            }
+
+            for user in users_future.result().get('users', []):
+                yield dict(user, kind='user')
+
+            done = 0
+            for future in as_completed(futures):
+                survey = futures[future]
+                try:
+                    responses = future.result().get('responses', [])
+                except (BudgetExceeded, LLMError) as e:
+                    print(f"   Warning: skipping responses for '{survey['name']}': {e}")
+                    continue
+                done += 1
+                print(f"   Generated responses for survey {done}/{len(surveys)}")
+                yield {
+                    'kind': 'response',
+                    'survey_key': survey['key'],
+                    'survey_name': survey['name'],
+                    'responses': responses
+                }
+
+        print(f"LLM calls: {budget.calls}, tokens used: {budget.tokens_used}")
+        if policy.budget.used:
+            print(f"LLM retries: {policy.budget.used}")
+        if cache is not None:
+            print(f"LLM cache: {cache.hits} hits, {cache.misses} misses ({cache.hit_rate:.0%} hit rate)")
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def generate_records(provider='openai', model='gpt-4o-mini', synthetic=None, **llm_options):
+    """Return the record stream for `provider`.
+
+    `synthetic` holds the options for the offline synthetic engine; the
+    remaining keyword arguments configure the LLM providers.
+    """
+    if provider == 'synthetic':
+        return synthetic_records(**(synthetic or {}))
+    return llm_records(provider, model, **llm_options)
+
+
+def generate_command(provider='openai', model='gpt-4o-mini', output=DEFAULT_OUTPUT, workers=1,
+                     **options):
     """Generate test data for Formbricks"""
     print(f"Generating data using {provider}...")
-    
-    data = {
-        "surveys": [
-            {
-                "title": "Product Feedback",
-                "description": "Help us improve",
-                "questions": [{"text": "How satisfied?", "type": "rating"}]
-            }
-        ],
-        "users": [{"email": f"user{i}@example.com", "name": f"User {i}", "role": "Manager"} for i in range(10)]
-    }
-    
-    os.makedirs('data', exist_ok=True)
-    with open('data/generated_data.json', 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    print("Data generated in data/generated_data.json")
+
+    if provider == 'synthetic' and workers > 1:
+        shards, counts = generate_sharded(output, workers, **(options.get('synthetic') or {}))
+        print(f"Data generated in {output} ({shards} shards, {workers} workers): "
+              f"{counts.get('survey', 0)} surveys, {counts.get('user', 0)} users, "
+              f"{counts.get('response', 0)} responses")
+        return
+
+    try:
+        with RecordWriter(output) as writer:
+            for record in generate_records(provider, model, **options):
+                writer.write(record)
+    except LLMError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    counts = writer.counts
+    print(f"Data generated in {output}: {counts['survey']} surveys, "
+          f"{counts['user']} users, {counts['response']} responses")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import os
+import queue
+import sys
+import threading
+
+from commands.generate import DEFAULT_OUTPUT, generate_records
+from commands.seed import failure_count, load_config, seed_records
+from core.datafile import EncodedRecords, RecordWriter
+
+_DONE = object()
+
+
+def _put(channel, item, stop):
+    """Put `item` on the channel unless the seeder has stopped; return whether it was put"""
+    while not stop.is_set():
+        try:
+            channel.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce(records, writer, channel, errors, stop):
+    """Generator thread: save each record and hand it to the seeder"""
+    try:
+        for record in records:
+            writer.write(record)
+            decoded = record.decoded() if isinstance(record, EncodedRecords) else (record,)
+            for item in decoded:
+                if not _put(channel, item, stop):
+                    # The seeder exited early; nobody is reading the channel any more
+                    return
+    except BaseException as e:
+        # Provider failures (LLMError, BudgetExceeded, ...) are reported by the main thread
+        errors.append(e)
+    finally:
+        writer.close()
+        _put(channel, _DONE, stop)
+
+
+def _consume(channel):
+    while True:
+        record = channel.get()
+        if record is _DONE:
+            return
+        yield record
+
+
+def pipeline_command(config_path='config.json', provider='openai', model='gpt-4o-mini',
+                     output=DEFAULT_OUTPUT, queue_size=1000, generation_options=None,
+                     **seed_options):
+    """Generate data and seed it into Formbricks at the same time"""
+    print(f"Running generate -> seed pipeline using {provider}...")
+
+    if not os.path.exists(config_path):
+        print(f"Error: {config_path} not found")
+        return
+
+    try:
+        config = load_config(config_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    channel = queue.Queue(maxsize=max(1, queue_size))
+    errors = []
+    stop = threading.Event()
+    writer = RecordWriter(output)
+    records = generate_records(provider, model, **(generation_options or {}))
+    producer = threading.Thread(
+        target=_produce, args=(records, writer, channel, errors, stop), name='generate', daemon=True
+    )
+    producer.start()
+    try:
+        stats = seed_records(config, _consume(channel), **seed_options)
+    finally:
+        # Unblock the producer if seeding exited early, so the output file is still closed
+        stop.set()
+        producer.join()
+
+    if errors:
+        print(f"Error: generation stopped early: {errors[0]!r}")
+        sys.exit(1)
+    print(f"Generated data saved in {output}")
+    if failure_count(stats):
+        sys.exit(1)
+    return stats
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from commands.seed import load_config
+from core.api import FormbricksAPI
+from core.journal import DEFAULT_JOURNAL, prune_surveys, recorded_survey_ids
+from core.ratelimit import AdaptiveRateLimiter
+from core.registry import DEFAULT_REGISTRY, SurveyRegistry
+from core.retry import RetryBudget, RetryPolicy
+from core.schema import seed_marker
+from core.transport import Transport
+
+
+def local_survey_ids(registry_path, journal_path):
+    """IDs of surveys recorded by earlier seed runs, in the order they were created"""
+    ids = [entry.id for entry in SurveyRegistry.load(registry_path)]
+    return list(dict.fromkeys(ids + recorded_survey_ids(journal_path)))
+
+
+def discover_survey_ids(api):
+    """IDs of every survey on the server that carries a seed marker"""
+    return [survey['id'] for survey in api.list_surveys() if seed_marker(survey) is not None]
+
+
+def _delete(api, survey_id):
+    """Delete one survey; return 'deleted', 'missing' or the error"""
+    try:
+        api.delete_survey(survey_id)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return 'missing'
+        return e
+    except requests.exceptions.RequestException as e:
+        return e
+    return 'deleted'
+
+
+def purge_command(config_path='config.json', registry_path=DEFAULT_REGISTRY,
+                  journal_path=DEFAULT_JOURNAL, discover=False, concurrency=16, rate=0.0,
+                  retries=4, dry_run=False):
+    """Delete seeded surveys, and with them their responses, through the Management API"""
+    print("Purging seeded data from Formbricks...")
+
+    if not os.path.exists(config_path):
+        print(f"Error: {config_path} not found")
+        return
+
+    try:
+        config = load_config(config_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    limiter = AdaptiveRateLimiter(rate) if rate > 0 else None
+    transport = Transport(config['base_url'], api_key=config['api_key'], pool_size=concurrency,
+                          rate_limiter=limiter,
+                          retry_policy=RetryPolicy(attempts=retries, budget=RetryBudget(1000)))
+    api = FormbricksAPI(config['base_url'], config['api_key'], config['environment_id'],
+                        transport=transport)
+    try:
+        survey_ids = local_survey_ids(registry_path, journal_path)
+        if discover:
+            try:
+                survey_ids = list(dict.fromkeys(survey_ids + discover_survey_ids(api)))
+            except requests.exceptions.RequestException as e:
+                print(f"Error: could not list surveys: {e}")
+                sys.exit(1)
+        if not survey_ids:
+            print("Nothing to purge" + ("" if discover else "; add --discover to find seeded "
+                                                            "surveys on the server"))
+            return
+        if dry_run:
+            print(f"Would delete {len(survey_ids)} surveys:")
+            for survey_id in survey_ids:
+                print(f"   {survey_id}")
+            return
+
+        print(f"Deleting {len(survey_ids)} surveys with concurrency {concurrency}...")
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            results = list(pool.map(lambda survey_id: _delete(api, survey_id), survey_ids))
+        elapsed = time.monotonic() - start
+    finally:
+        transport.close()
+
+    gone = {survey_id for survey_id, result in zip(survey_ids, results)
+            if result in ('deleted', 'missing')}
+    failed = [(survey_id, result) for survey_id, result in zip(survey_ids, results)
+              if survey_id not in gone]
+    for survey_id, error in failed[:5]:
+        print(f"   Warning: failed to delete survey {survey_id}: {error}")
+
+    # Forget purged surveys so a later --resume or --delta run recreates them
+    registry = SurveyRegistry.load(registry_path)
+    if len(registry):
+        SurveyRegistry.from_records(entry.to_dict() for entry in registry
+                                    if entry.id not in gone).save(registry_path)
+    prune_surveys(journal_path, gone)
+
+    print(f"Purged {results.count('deleted')} surveys and their responses in {elapsed:.2f}s "
+          f"(already gone: {results.count('missing')}, failed: {len(failed)})")
+    if failed:
+        sys.exit(1)
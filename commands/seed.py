@@ -1,17 +1,153 @@
 #!/usr/bin/env python3
+import asyncio
 import json
 import os
+import sys
 
-def seed_command(config_path='config.json'):
+from core.api import FormbricksAPI
+from core.datafile import read_records
+from core.engine import SeedEngine, SeedError
+from core.journal import DEFAULT_JOURNAL, SeedJournal
+from core.ratelimit import AdaptiveRateLimiter
+from core.registry import DEFAULT_REGISTRY, SurveyRegistry
+from core.retry import RetryBudget, RetryPolicy
+from core.transport import Transport
+
+
+def load_config(config_path):
+    """Load API configuration"""
+    with open(config_path) as f:
+        config = json.load(f)
+
+    for key in ('base_url', 'api_key', 'environment_id'):
+        if not config.get(key):
+            raise ValueError(f"'{key}' missing from {config_path}")
+    return config
+
+
+async def _run_async(engine, records, transport):
+    try:
+        return await engine.run(records)
+    finally:
+        await transport.close()
+
+
+def seed_records(config, records, concurrency=8, rate=20.0, max_rate=500.0, compress=False,
+                 batch_size=50, journal_path=DEFAULT_JOURNAL, resume=False,
+                 registry_path=DEFAULT_REGISTRY, retries=4, retry_budget=1000, engine='threads',
+                 delta=False):
+    """Seed a stream of generated records into the Formbricks instance in `config`.
+
+    `engine` is 'threads' (a worker pool) or 'async' (one asyncio event loop on aiohttp).
+    With `delta`, surveys already on the server are skipped or updated instead of recreated.
+    """
+    limiter = AdaptiveRateLimiter(rate, max_rate=max_rate) if rate > 0 else None
+    budget = RetryBudget(retry_budget)
+    policy = RetryPolicy(attempts=retries, budget=budget)
+    if engine == 'async':
+        from core.async_api import AsyncFormbricksAPI, AsyncTransport
+        from core.async_engine import AsyncSeedEngine
+        transport = AsyncTransport(config['base_url'], api_key=config['api_key'], limit=concurrency,
+                                   rate_limiter=limiter, compress=compress, retry_policy=policy)
+        api_class, engine_class = AsyncFormbricksAPI, AsyncSeedEngine
+    else:
+        transport = Transport(config['base_url'], api_key=config['api_key'], pool_size=concurrency,
+                              rate_limiter=limiter, compress=compress, retry_policy=policy)
+        api_class, engine_class = FormbricksAPI, SeedEngine
+    api = api_class(
+        base_url=config['base_url'],
+        api_key=config['api_key'],
+        environment_id=config['environment_id'],
+        transport=transport
+    )
+
+    journal = SeedJournal(journal_path, resume=resume)
+    if resume:
+        print(f"Resuming from {journal_path}: {len(journal.surveys)} surveys, "
+              f"{sum(len(done) for done in journal.responses.values())} responses, "
+              f"{len(journal.invites)} invites already done")
+
+    # On resume, surveys recorded in the journal are reused instead of recreated
+    registry = SurveyRegistry.from_records(journal.surveys.values()) if resume else SurveyRegistry()
+    seeder = engine_class(api, concurrency=concurrency, batch_size=batch_size, journal=journal,
+                          registry=registry, delta=delta, retry_policy=policy)
+    try:
+        if engine == 'async':
+            stats = asyncio.run(_run_async(seeder, records, transport))
+        else:
+            stats = seeder.run(records)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted. Progress is saved in {journal_path}; re-run with --resume to continue")
+        sys.exit(130)
+    except SeedError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        # Merge into the saved index, so surveys from earlier runs are not forgotten
+        saved = SurveyRegistry.load(registry_path)
+        saved.update(registry)
+        saved.save(registry_path)
+        journal.close()
+        if engine != 'async':
+            transport.close()
+
+    failed = failure_count(stats)
+    print(f"Data seeded with {failed} failures (see above)" if failed
+          else "Data seeded successfully")
+    print(f"   Surveys created: {stats.counts.get('survey', 0)} "
+          f"(failed: {stats.failures.get('survey', 0)})")
+    print(f"   Responses created: {stats.counts.get('response', 0)} "
+          f"(failed: {stats.failures.get('response', 0)}, "
+          f"batches with failures: {stats.failures.get('batch', 0)})")
+    print(f"   Users invited: {stats.counts.get('user', 0)} "
+          f"(already existed: {stats.counts.get('user_existing', 0)}, "
+          f"duplicates skipped: {stats.counts.get('user_duplicate', 0)}, "
+          f"failed: {stats.failures.get('user', 0)})")
+    if delta:
+        print(f"   Delta: {stats.counts.get('survey_unchanged', 0)} surveys unchanged, "
+              f"{stats.counts.get('survey_updated', 0)} updated "
+              f"(failed: {stats.failures.get('survey_updated', 0)}), "
+              f"{stats.counts.get('response_unchanged', 0)} responses of existing surveys skipped")
+    skipped = sum(stats.counts.get(kind, 0) for kind in ('survey_skipped', 'response_skipped',
+                                                        'user_skipped'))
+    if skipped:
+        print(f"   Skipped {skipped} items already recorded in {journal_path}")
+    print(f"   {stats.requests} requests in {stats.elapsed:.2f}s "
+          f"({stats.throughput:.1f} req/s)")
+    if budget.used:
+        print(f"   Retried {budget.used} requests"
+              + (" (retry budget exhausted)" if budget.exhausted else ""))
+    if limiter is not None:
+        print(f"   Final request rate: {limiter.rate:.1f} req/s")
+    return stats
+
+
+def failure_count(stats):
+    """Number of items that failed in a seeding run, including unexpected task errors"""
+    # A failed batch is already counted through its failed responses
+    return sum(count for kind, count in stats.failures.items() if kind != 'batch')
+
+
+def seed_command(config_path='config.json', data_file='data/generated_data.jsonl', **options):
     """Seed Formbricks with generated data"""
     print("Seeding Formbricks...")
-    
+
     if not os.path.exists(config_path):
         print(f"Error: {config_path} not found")
         return
-    
-    if not os.path.exists('data/generated_data.json'):
+
+    if not os.path.exists(data_file):
         print("Error: Run 'python main.py formbricks generate' first")
         return
-    
-    print("Data seeded successfully")
+
+    try:
+        config = load_config(config_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+
+    print(f"Seeding from {data_file} with concurrency {options.get('concurrency', 8)}...")
+    stats = seed_records(config, read_records(data_file), **options)
+    if failure_count(stats):
+        sys.exit(1)
+    return stats
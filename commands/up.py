@@ -2,15 +2,37 @@
 import subprocess
 import sys
 
-def up_command():
+from core import metrics
+from core.readiness import Readiness
+
+FORMBRICKS_URL = 'http://localhost:3000'
+
+
+def up_command(max_wait=180):
     """Start Formbricks with Docker Compose"""
     print("Starting Formbricks...")
+    # Watch compose events and probe health from the start so no signal is missed
+    readiness = Readiness(FORMBRICKS_URL)
+    readiness.start()
     try:
-        result = subprocess.run(['docker', 'compose', 'up', '-d'], check=True, cwd='.')
-        print("Formbricks is starting. Access at http://localhost:3000")
+        with metrics.timer('docker_startup'):
+            subprocess.run(['docker', 'compose', 'up', '-d'], check=True, cwd='.')
     except subprocess.CalledProcessError as e:
+        readiness.stop()
         print(f"Error: {e}")
         sys.exit(1)
     except FileNotFoundError:
+        readiness.stop()
         print("Error: docker-compose not found. Please install Docker.")
         sys.exit(1)
+
+    print("Waiting for Formbricks to become ready...")
+    readiness.watch_logs()
+    with metrics.timer('health_wait'):
+        ready = readiness.wait(max_wait)
+    print("Readiness timeline:")
+    print(readiness.timeline.format())
+    if not ready:
+        print("Error: Formbricks did not become healthy in time. Check: docker compose logs formbricks")
+        sys.exit(1)
+    print(f"Formbricks is running. Access at {FORMBRICKS_URL}")
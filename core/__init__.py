@@ -0,0 +1 @@
+"""Shared building blocks for the Formbricks Challenge CLI commands"""
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Formbricks Management and Client API client"""
+from core import metrics
+from core.encoding import encode_json
+from core.schema import Survey
+from core.transport import Transport
+
+
+class FormbricksAPI:
+    """Formbricks API client for Management and Client APIs"""
+
+    def __init__(self, base_url, api_key, environment_id=None, transport=None):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.environment_id = environment_id
+        self.transport = transport or Transport(base_url, api_key=api_key)
+
+    def create_survey(self, survey, idempotency_key=None):
+        """Create a survey using Management API.
+
+        Accepts a validated Survey or a raw generated record, which is
+        validated first and raises SchemaError before any request is sent.
+        """
+        if not isinstance(survey, Survey):
+            survey = Survey.from_record(survey)
+        with metrics.timer('payload_build', payload='survey'):
+            body = survey.encoded_payload()
+        response = self.transport.post('/api/v1/management/surveys', body=body,
+                                       idempotency_key=idempotency_key)
+        response.raise_for_status()
+        return response.json()['data']
+
+    def list_surveys(self):
+        """List the surveys of the environment behind the API key"""
+        response = self.transport.get('/api/v1/management/surveys')
+        response.raise_for_status()
+        return response.json()['data']
+
+    def get_survey(self, survey_id):
+        response = self.transport.get(f"/api/v1/management/surveys/{survey_id}")
+        response.raise_for_status()
+        return response.json()['data']
+
+    def update_survey(self, survey_id, survey):
+        """Replace a survey's content with `survey` (a Survey or generated record)"""
+        if not isinstance(survey, Survey):
+            survey = Survey.from_record(survey)
+        with metrics.timer('payload_build', payload='survey'):
+            body = survey.encoded_payload()
+        response = self.transport.put(f"/api/v1/management/surveys/{survey_id}", body=body)
+        response.raise_for_status()
+        return response.json()['data']
+
+    def delete_survey(self, survey_id):
+        """Delete a survey and, with it, all of its responses"""
+        response = self.transport.delete(f"/api/v1/management/surveys/{survey_id}")
+        response.raise_for_status()
+        return response.json().get('data', {})
+
+    def create_response(self, survey_id, response_data, idempotency_key=None):
+        """Create a survey response using Client API"""
+        with metrics.timer('payload_build', payload='response'):
+            data = {}
+            for resp in response_data['responses']:
+                data[resp['questionId']] = resp['value']
+
+            payload = {
+                'surveyId': survey_id,
+                'finished': True,
+                'data': data,
+                'meta': {
+                    'userAgent': 'FormbricksSeeder/1.0'
+                }
+            }
+            body = encode_json(payload)
+
+        # Client API doesn't use x-api-key
+        response = self.transport.post(f"/api/v1/client/{self.environment_id}/responses",
+                                       body=body, auth=False, idempotency_key=idempotency_key)
+        response.raise_for_status()
+        return response.json()
+
+    def create_responses(self, survey_id, batch, idempotency_keys=None):
+        """Create a batch of responses for one survey.
+
+        The Client and Management APIs have no bulk endpoint, so the batch is
+        sent back-to-back by one worker over its pooled keep-alive connection.
+        Returns a list of (index, error) pairs for the items that failed.
+        """
+        failures = []
+        for index, response_data in enumerate(batch):
+            try:
+                self.create_response(survey_id, response_data,
+                                     idempotency_keys[index] if idempotency_keys else None)
+            except Exception as e:
+                failures.append((index, e))
+        return failures
+
+    def list_users(self):
+        """List the members of the organization behind the API key"""
+        response = self.transport.get('/api/v1/management/users')
+        response.raise_for_status()
+        return response.json()['data']
+
+    def invite_user(self, email, name, role, idempotency_key=None):
+        """Invite a user using Management API"""
+        payload = {
+            'email': email,
+            'name': name,
+            'role': role.lower()
+        }
+
+        response = self.transport.post('/api/v1/management/users', payload,
+                                       idempotency_key=idempotency_key)
+
+        # User might already exist, that's okay
+        if response.status_code in [200, 201]:
+            return response.json().get('data', {})
+        elif response.status_code == 409:
+            return {'email': email, 'status': 'already_exists'}
+        response.raise_for_status()
+        return {}
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""asyncio Formbricks client on aiohttp (optional: pip install aiohttp).
+
+One event loop holds thousands of requests in flight over a pooled,
+keep-alive connector, without a thread per request. Rate limiting, retries
+and idempotency keys behave exactly like the threaded Transport.
+"""
+import asyncio
+import gzip
+import json
+import time
+
+from core import metrics
+from core.encoding import encode_json
+from core.retry import IDEMPOTENCY_HEADER, classify_status
+from core.schema import Survey
+from core.transport import GZIP_MIN_BYTES, IDEMPOTENT_METHODS
+
+
+def _aiohttp():
+    try:
+        import aiohttp
+    except ImportError:
+        raise RuntimeError("The async engine requires aiohttp: pip install aiohttp")
+    return aiohttp
+
+
+class AsyncHTTPError(Exception):
+    """Raised by AsyncResponse.raise_for_status() for 4xx and 5xx responses"""
+
+    def __init__(self, response):
+        super().__init__(f"{response.status} error for {response.method} {response.url}: "
+                         f"{response.text[:200]}")
+        self.response = response
+
+
+class AsyncResponse:
+    """Fully read response, so the connection is back in the pool before the caller sees it"""
+
+    __slots__ = ('method', 'url', 'status_code', 'headers', 'content')
+
+    def __init__(self, method, url, status_code, headers, content):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def status(self):
+        return self.status_code
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content) if self.content else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AsyncHTTPError(self)
+
+
+class AsyncTransport:
+    """aiohttp counterpart of core.transport.Transport.
+
+    `limit` bounds both the connection pool and the number of requests in
+    flight; further requests wait on a semaphore instead of piling up.
+    """
+
+    def __init__(self, base_url, api_key=None, limit=100, rate_limiter=None, compress=False,
+                 timeout=30, retry_policy=None):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.limit = max(1, limit)
+        self.rate_limiter = rate_limiter
+        self.compress = compress
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self._session = None
+        self._semaphore = None
+
+    def _open(self):
+        # The session and semaphore must be created inside the running event loop
+        if self._session is None:
+            aiohttp = _aiohttp()
+            headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._session
+
+    async def request(self, method, path, json_body=None, body=None, auth=True, timeout=None,
+                      idempotency_key=None):
+        """Send a request and return an AsyncResponse, without raising on HTTP errors"""
+        aiohttp = _aiohttp()
+        session = self._open()
+        headers = {}
+        if auth and self.api_key:
+            headers['x-api-key'] = self.api_key
+        if idempotency_key:
+            headers[IDEMPOTENCY_HEADER] = idempotency_key
+
+        data = body
+        if data is None and json_body is not None:
+            data = encode_json(json_body)
+        if data is not None and self.compress and len(data) >= GZIP_MIN_BYTES:
+            data = gzip.compress(data, compresslevel=1)
+            headers['Content-Encoding'] = 'gzip'
+
+        policy = self.retry_policy
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response, error = await self._send(session, method, path, data, headers, timeout), None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                response, error = None, e
+            # A refused connection never reached the server, so any request may be resent;
+            # this matches core.retry.request_unsent for the threaded engine
+            unsent = isinstance(error, aiohttp.ClientConnectorError)
+            if policy is None:
+                wait = None
+            elif error is not None:
+                retryable = isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+                wait = policy.next_delay(attempt, retryable and (idempotent or unsent))
+            else:
+                wait = policy.next_delay(attempt, *classify_status(response.status_code,
+                                                                   response.headers, idempotent))
+            if wait is None:
+                if error is not None:
+                    error.unsent = unsent
+                    raise error
+                return response
+            await policy.sleep_async(wait)
+            attempt += 1
+
+    async def _send(self, session, method, path, data, headers, timeout):
+        if self.rate_limiter is not None:
+            waited = await self.rate_limiter.acquire_async()
+            if waited:
+                metrics.observe('sleep', waited, reason='rate_limit')
+        async with self._semaphore:
+            url = self.base_url + path
+            start = time.monotonic()
+            try:
+                kwargs = {'timeout': _aiohttp().ClientTimeout(total=timeout)} if timeout else {}
+                async with session.request(method, url, data=data, headers=headers, **kwargs) as resp:
+                    content = await resp.read()
+                    response = AsyncResponse(method, url, resp.status, resp.headers, content)
+            except Exception as e:
+                latency = time.monotonic() - start
+                metrics.observe('http_request', latency, method=method)
+                metrics.count('http_error', error=type(e).__name__)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.record(None, latency)
+                raise
+        latency = time.monotonic() - start
+        metrics.observe('http_request', latency, method=method)
+        metrics.count('http_response', status=response.status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(response.status_code, latency)
+        return response
+
+    async def get(self, path, **kwargs):
+        return await self.request('GET', path, **kwargs)
+
+    async def post(self, path, json_body=None, **kwargs):
+        return await self.request('POST', path, json_body=json_body, **kwargs)
+
+    async def put(self, path, json_body=None, **kwargs):
+        return await self.request('PUT', path, json_body=json_body, **kwargs)
+
+    async def delete(self, path, **kwargs):
+        return await self.request('DELETE', path, **kwargs)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncFormbricksAPI:
+    """asyncio counterpart of core.api.FormbricksAPI with the same methods"""
+
+    def __init__(self, base_url, api_key, environment_id=None, transport=None, limit=100):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.environment_id = environment_id
+        self.transport = transport or AsyncTransport(base_url, api_key=api_key, limit=limit)
+
+    async def create_survey(self, survey, idempotency_key=None):
+        if not isinstance(survey, Survey):
+            survey = Survey.from_record(survey)
+        with metrics.timer('payload_build', payload='survey'):
+            body = survey.encoded_payload()
+        response = await self.transport.post('/api/v1/management/surveys', body=body,
+                                             idempotency_key=idempotency_key)
+        response.raise_for_status()
+        return response.json()['data']
+
+    async def list_surveys(self):
+        response = await self.transport.get('/api/v1/management/surveys')
+        response.raise_for_status()
+        return response.json()['data']
+
+    async def get_survey(self, survey_id):
+        response = await self.transport.get(f"/api/v1/management/surveys/{survey_id}")
+        response.raise_for_status()
+        return response.json()['data']
+
+    async def update_survey(self, survey_id, survey):
+        if not isinstance(survey, Survey):
+            survey = Survey.from_record(survey)
+        with metrics.timer('payload_build', payload='survey'):
+            body = survey.encoded_payload()
+        response = await self.transport.put(f"/api/v1/management/surveys/{survey_id}", body=body)
+        response.raise_for_status()
+        return response.json()['data']
+
+    async def delete_survey(self, survey_id):
+        response = await self.transport.delete(f"/api/v1/management/surveys/{survey_id}")
+        response.raise_for_status()
+        return response.json().get('data', {})
+
+    async def create_response(self, survey_id, response_data, idempotency_key=None):
+        with metrics.timer('payload_build', payload='response'):
+            data = {}
+            for resp in response_data['responses']:
+                data[resp['questionId']] = resp['value']
+            body = encode_json({
+                'surveyId': survey_id,
+                'finished': True,
+                'data': data,
+                'meta': {
+                    'userAgent': 'FormbricksSeeder/1.0'
+                }
+            })
+        # Client API doesn't use x-api-key
+        response = await self.transport.post(f"/api/v1/client/{self.environment_id}/responses",
+                                             body=body, auth=False, idempotency_key=idempotency_key)
+        response.raise_for_status()
+        return response.json()
+
+    async def create_responses(self, survey_id, batch, idempotency_keys=None):
+        """Send a batch of responses concurrently; return (index, error) pairs for failures"""
+        results = await asyncio.gather(
+            *(self.create_response(survey_id, response_data,
+                                   idempotency_keys[index] if idempotency_keys else None)
+              for index, response_data in enumerate(batch)),
+            return_exceptions=True)
+        return [(index, result) for index, result in enumerate(results)
+                if isinstance(result, Exception)]
+
+    async def list_users(self):
+        response = await self.transport.get('/api/v1/management/users')
+        response.raise_for_status()
+        return response.json()['data']
+
+    async def invite_user(self, email, name, role, idempotency_key=None):
+        payload = {
+            'email': email,
+            'name': name,
+            'role': role.lower()
+        }
+        response = await self.transport.post('/api/v1/management/users', payload,
+                                             idempotency_key=idempotency_key)
+        if response.status_code in [200, 201]:
+            return response.json().get('data', {})
+        elif response.status_code == 409:
+            return {'email': email, 'status': 'already_exists'}
+        response.raise_for_status()
+        return {}
+
+    async def close(self):
+        await self.transport.close()
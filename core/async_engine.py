@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Seeding engine on one asyncio event loop, for concurrency beyond a thread pool"""
+import asyncio
+import itertools
+import time
+
+from core.engine import SeedEngine
+
+# Records are pulled from the (possibly blocking) reader this many at a time
+READ_CHUNK = 256
+
+
+class AsyncSeedEngine(SeedEngine):
+    """SeedEngine whose work items run as tasks against an AsyncFormbricksAPI.
+
+    The work items themselves are SeedEngine's, so ordering, journalling, the
+    registry and the idempotency keys are identical; only the scheduling and
+    the awaiting of API calls differ. Each in-flight item costs a
+    task rather than a thread, so `concurrency` can be in the thousands. The
+    number of pending tasks is capped at four per unit of concurrency, which
+    keeps memory flat for any dataset size.
+    """
+
+    async def run(self, records):
+        """Seed every record and return the run statistics"""
+        loop = asyncio.get_running_loop()
+        records = iter(records)
+        if self.delta:
+            self._remote = await self._run_steps(self._list_remote())
+        self._tasks = set()
+        try:
+            while True:
+                # Reading may block (files, the pipeline queue), so keep it off the loop
+                chunk = await loop.run_in_executor(None, _take, records, READ_CHUNK)
+                if not chunk:
+                    break
+                for record in chunk:
+                    await self._add(record)
+            for key in list(self._buffers):
+                self._flush(key)
+            if self._tasks:
+                await asyncio.wait(self._tasks)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+
+        self._report_stale()
+        self.stats.finished = time.monotonic()
+        return self.stats
+
+    async def _add(self, record):
+        while len(self._tasks) >= self.concurrency * 4:
+            await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+        kind = record.get('kind')
+        if kind == 'survey':
+            self._add_survey(record)
+        elif kind == 'response':
+            task = self._survey_futures.get(record.get('survey_key') or record.get('survey_name'))
+            if task is not None and not task.done():
+                # Hold the reader, not the loop, until this survey exists
+                await asyncio.wait([task])
+            self._add_response(record)
+        elif kind == 'user':
+            if self._members is None:
+                self._members = await self._run_steps(self._fetch_members())
+            self._add_user(record)
+
+    async def _run_steps(self, steps):
+        """SeedEngine._run_steps, awaiting each call the work item yields"""
+        try:
+            fn, args, kwargs = next(steps)
+            while True:
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception as e:
+                    fn, args, kwargs = steps.throw(e)
+                else:
+                    fn, args, kwargs = steps.send(result)
+        except StopIteration as done:
+            return done.value
+
+    async def _pause(self, seconds, stage):
+        await self.retry_policy.sleep_async(seconds, stage)
+
+    def _submit(self, steps):
+        task = asyncio.ensure_future(self._run_steps(steps))
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._task_failed(task.exception())
+
+
+def _take(iterator, count):
+    return list(itertools.islice(iterator, count))
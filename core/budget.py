@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Per-provider request rate and token budgets for LLM calls"""
+import threading
+
+from core import metrics
+from core.ratelimit import TokenBucket
+
+# Requests per minute applied when the caller does not choose one (0 = unlimited)
+PROVIDER_RPM = {
+    'openai': 500,
+    'ollama': 0,
+}
+
+
+class BudgetExceeded(Exception):
+    """Raised when an LLM call would go over the token budget"""
+
+
+class LLMBudget:
+    """Pace LLM requests and stop issuing them once the token budget is spent.
+
+    The token budget is checked before each call and charged after it, so
+    calls already in flight may overshoot it by up to one call per worker.
+    """
+
+    def __init__(self, provider, rpm=None, max_tokens=0):
+        if rpm is None:
+            rpm = PROVIDER_RPM.get(provider, 0)
+        self.provider = provider
+        self.max_tokens = max_tokens
+        self.tokens_used = 0
+        self.calls = 0
+        self._bucket = TokenBucket(rpm / 60.0, burst=max(1.0, rpm / 60.0)) if rpm else None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait for a request slot; raise BudgetExceeded if tokens are exhausted"""
+        with self._lock:
+            if self.max_tokens and self.tokens_used >= self.max_tokens:
+                raise BudgetExceeded(
+                    f"{self.provider} token budget of {self.max_tokens} exhausted")
+        if self._bucket is not None:
+            waited = self._bucket.acquire()
+            if waited:
+                metrics.observe('sleep', waited, reason='llm_rpm')
+
+    def spend(self, tokens):
+        with self._lock:
+            self.calls += 1
+            self.tokens_used += tokens or 0
+        metrics.count('llm_tokens', tokens or 0, provider=self.provider)
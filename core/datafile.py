@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Streaming JSONL record files for generated data.
+
+Each line is one JSON object tagged with a `kind` of survey, user or
+response. A `shard` record points at another record file, relative to this
+one, whose records are read in its place. Files ending in .gz are
+gzip-compressed and files ending in .zst are zstd-compressed (requires the
+optional `zstandard` package). Legacy single-document .json files can still
+be read; a .json file holding JSONL, such as `generate --output x.json`
+writes, is read as JSONL.
+"""
+import gzip
+import io
+import json
+import os
+
+RECORD_KINDS = ('survey', 'user', 'response', 'shard')
+
+
+def open_data_file(path, mode='r'):
+    """Open a record file for text reading ('r') or writing ('w')"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+    if path.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError("Reading or writing .zst files requires: pip install zstandard")
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'), closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class EncodedRecords:
+    """A chunk of already-encoded JSONL lines, all of one kind.
+
+    Fast producers emit these to skip per-record encoding; RecordWriter
+    writes them verbatim and decoded() turns them back into records.
+    """
+
+    __slots__ = ('kind', 'text', 'count')
+
+    def __init__(self, kind, text, count):
+        self.kind = kind
+        self.text = text
+        self.count = count
+
+    def decoded(self):
+        for line in self.text.splitlines():
+            yield json.loads(line)
+
+
+def iter_decoded(records):
+    """Flatten a stream that may contain EncodedRecords into plain records"""
+    for record in records:
+        if isinstance(record, EncodedRecords):
+            yield from record.decoded()
+        else:
+            yield record
+
+
+class RecordWriter:
+    """Append tagged records to a JSONL file as they are produced"""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.counts = dict.fromkeys(RECORD_KINDS, 0)
+        self._file = open_data_file(path, 'w')
+        self._encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+    def write(self, record):
+        if isinstance(record, EncodedRecords):
+            self._file.write(record.text)
+            self.counts[record.kind] += record.count
+            return
+        kind = record['kind']
+        if kind not in self.counts:
+            raise ValueError(f"Unknown record kind: {kind}")
+        self._file.write(self._encode(record))
+        self._file.write('\n')
+        self.counts[kind] += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _legacy_records(path):
+    """Yield tagged records from a single-document generated_data.json"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    for survey in data.get('surveys', []):
+        yield dict(survey, kind='survey')
+    for user in data.get('users', []):
+        yield dict(user, kind='user')
+    for response in data.get('responses', []):
+        yield dict(response, kind='response')
+
+
+def _is_legacy(path):
+    """True if the .json file at `path` is one document rather than tagged JSONL lines"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                try:
+                    first = json.loads(line)
+                except ValueError:
+                    # A pretty-printed document does not parse line by line
+                    return True
+                return not (isinstance(first, dict) and 'kind' in first)
+    return False
+
+
+def read_records(path):
+    """Yield tagged records one at a time without loading the whole file"""
+    if path.endswith('.json') and _is_legacy(path):
+        yield from _legacy_records(path)
+        return
+    with open_data_file(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if record.get('kind') == 'shard':
+                    yield from read_records(os.path.join(os.path.dirname(path), record['path']))
+                else:
+                    yield record
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Fast compact JSON encoding for request bodies"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def encode_json(obj):
+    """Serialize `obj` to compact UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _encoder.encode(obj).encode('utf-8')
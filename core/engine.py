@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Concurrent seeding engine built on a bounded thread pool"""
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from core import metrics
+from core.registry import SurveyEntry, SurveyRegistry
+from core.retry import RetryPolicy, outcome_unknown, was_unsent
+from core.schema import SchemaError, Survey, key_digest, seed_marker
+
+
+_print_lock = threading.Lock()
+
+
+class SeedError(RuntimeError):
+    """Raised when a seeding run cannot start"""
+
+
+def log(message):
+    """print() from worker threads without interleaving lines"""
+    with _print_lock:
+        sys.stdout.write(message + '\n')
+        sys.stdout.flush()
+
+
+def call(fn, *args, **kwargs):
+    """An API call for a work item to yield; the engine performs it and sends back the result"""
+    return fn, args, kwargs
+
+
+def member_emails(members):
+    return {member['email'].strip().lower() for member in members if member.get('email')}
+
+
+class SeedStats:
+    """Thread-safe counters for a seeding run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {}
+        self.failures = {}
+        self.requests = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    def record(self, kind, ok, requests=1):
+        self.add(kind, created=int(ok), failed=int(not ok), requests=requests)
+
+    def add(self, kind, created=0, failed=0, requests=0):
+        with self._lock:
+            self.requests += requests
+            if created:
+                self.counts[kind] = self.counts.get(kind, 0) + created
+            if failed:
+                self.failures[kind] = self.failures.get(kind, 0) + failed
+
+    @property
+    def elapsed(self):
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started
+
+    @property
+    def throughput(self):
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class SeedEngine:
+    """Seed a stream of survey, user and response records through a bounded worker pool.
+
+    Records are consumed one at a time, so memory stays flat regardless of
+    dataset size: at most a few tasks per worker are queued, and only the
+    survey currently being read holds a partial response batch. A response only waits for its
+    own survey to be created; everything else runs in parallel. When a
+    journal is given, completed work is recorded in it and work it already
+    holds is skipped. Created surveys are indexed in `registry`; surveys
+    already present in it (for example, replayed from the journal) are reused.
+    Every create call carries an idempotency key derived from the run and the
+    record, but Formbricks ignores it, so nothing that may already have been
+    applied is sent again. A survey whose create failed ambiguously is looked
+    up by its seed marker first, which names the run, so an earlier run's copy
+    is never adopted; invites are safe to repeat (409); responses are only
+    re-driven when they provably never reached the server.
+    These re-drives wait and draw on `retry_policy` like the transport's own
+    retries, so a dead server cannot multiply the attempts of a whole run.
+    Existing members are listed once, on the first user record; their emails,
+    and emails repeated in the stream, are skipped without an invite call.
+
+    With `delta`, the server's surveys are listed once up front and matched to
+    the stream by the seed marker in their payload: unchanged surveys are
+    skipped, changed ones are updated in place, and only new surveys are
+    created. Responses are only sent for surveys created in this run. The
+    comparison is against the hash recorded when a survey was last seeded, so
+    edits made on the server itself go unnoticed.
+
+    Work items are generators that yield their API calls (see `call`) and get
+    the results sent back, or the exceptions thrown in. _run_steps performs the
+    calls here; AsyncSeedEngine awaits them instead, so both engines share
+    every decision and all bookkeeping.
+    """
+
+    def __init__(self, api, concurrency=8, batch_size=1, batch_retries=2, journal=None,
+                 registry=None, delta=False, retry_policy=None):
+        self.api = api
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.batch_retries = batch_retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.journal = journal
+        self.stats = SeedStats()
+        self.run_id = journal.run_id if journal else uuid.uuid4().hex
+        self.run_digest = key_digest(self.run_id)
+        self.registry = registry if registry is not None else SurveyRegistry()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.concurrency * 4)
+        self._futures = set()
+        self._survey_futures = {}
+        self._buffers = {}
+        self._seen = {}
+        self._current = None
+        self._emails = set()
+        self._members = None
+        self.delta = delta
+        self._remote = None
+        self._matched = set()
+        self._reused = set()
+
+    def run(self, records):
+        """Seed every record and return the run statistics"""
+        if self.delta:
+            self._remote = self._run_steps(self._list_remote())
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            self._pool = pool
+            try:
+                for record in records:
+                    kind = record.get('kind')
+                    if kind == 'survey':
+                        self._add_survey(record)
+                    elif kind == 'response':
+                        self._add_response(record)
+                    elif kind == 'user':
+                        if self._members is None:
+                            self._members = self._run_steps(self._fetch_members())
+                        self._add_user(record)
+                for key in list(self._buffers):
+                    self._flush(key)
+            except KeyboardInterrupt:
+                with self._lock:
+                    for future in self._futures:
+                        future.cancel()
+                raise
+
+        self._report_stale()
+        self.stats.finished = time.monotonic()
+        return self.stats
+
+    def _run_steps(self, steps):
+        """Drive a work item to completion, performing each call it yields; return its result"""
+        try:
+            fn, args, kwargs = next(steps)
+            while True:
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    fn, args, kwargs = steps.throw(e)
+                else:
+                    fn, args, kwargs = steps.send(result)
+        except StopIteration as done:
+            return done.value
+
+    def _submit(self, steps):
+        self._slots.acquire()
+        future = self._pool.submit(self._run_steps, steps)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            self._task_failed(future.exception())
+
+    def _pause(self, seconds, stage):
+        """Wait before a re-drive; AsyncSeedEngine waits on the event loop instead"""
+        self.retry_policy.sleep(seconds, stage)
+
+    def _task_failed(self, error):
+        """Report a work item that died on an unexpected exception instead of losing it"""
+        log(f"   Error: seeding task failed: {error!r}")
+        self.stats.add('task', failed=1)
+
+    def _add_survey(self, record):
+        """Validate a survey up front so bad data never reaches the API"""
+        try:
+            survey = Survey.from_record(record)
+        except SchemaError as e:
+            log(f"   Warning: skipping invalid survey: {e}")
+            self.stats.record('survey', ok=False, requests=0)
+            return
+        survey.run = self.run_digest
+        if survey.key in self._survey_futures:
+            log(f"   Warning: skipping survey '{survey.name}': duplicate survey key {survey.key!r}")
+            self.stats.record('survey', ok=False, requests=0)
+            return
+        self._survey_futures[survey.key] = self._submit(self._create_survey(survey))
+
+    def _add_response(self, resp_data):
+        key = resp_data.get('survey_key')
+        future = self._survey_futures.get(key or resp_data.get('survey_name'))
+        if future is not None:
+            # Block the reader, not the pool, until this survey exists; a
+            # failure is reported by _release and shows up as "survey not found"
+            future.exception()
+        survey = self.registry.resolve(key, resp_data.get('survey_name'))
+        if survey is None:
+            key = key or resp_data.get('survey_name')
+            if key not in self._seen:
+                log(f"   Warning: survey not found for responses: {key}")
+            self._seen[key] = self._seen.get(key, 0) + 1
+            self.stats.add('response', failed=1)
+            return
+
+        key = survey.key
+        if key in self._reused:
+            # The server already holds this survey's responses from an earlier run
+            self.stats.add('response_unchanged', created=1)
+            return
+        if self._current != key:
+            # Responses usually arrive grouped by survey; ship the last group's
+            # partial batch now rather than holding it until the end of the stream
+            self._flush(self._current)
+            self._current = key
+
+        index = self._seen.get(key, 0)
+        self._seen[key] = index + 1
+        if self.journal and index in self.journal.responses.get(key, ()):
+            self.stats.add('response_skipped', created=1)
+            return
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append((index, resp_data))
+        if len(buffer) >= self.batch_size:
+            self._flush(key)
+
+    def _fetch_members(self):
+        """Lower-cased emails of existing members, fetched once so they cost no invite call"""
+        self.stats.add('members', requests=1)
+        try:
+            members = yield call(self.api.list_users)
+        except Exception as e:
+            # Without the list, existing members still come back as 409s
+            log(f"   Warning: could not list existing users: {e}")
+            return set()
+        return member_emails(members)
+
+    def _list_remote(self):
+        try:
+            surveys = yield call(self.api.list_surveys)
+        except Exception as e:
+            raise SeedError(f"cannot list existing surveys for --delta: {e}")
+        return self._remote_index(surveys)
+
+    def _add_user(self, user):
+        """Drop duplicate and already-existing emails before any invite is sent"""
+        email = user['email'].strip().lower()
+        if email in self._emails:
+            log(f"   Warning: skipping duplicate user {user['email']}")
+            self.stats.record('user_duplicate', ok=True, requests=0)
+            return
+        self._emails.add(email)
+        if email in self._members:
+            self.stats.record('user_existing', ok=True, requests=0)
+            return
+        self._submit(self._invite_user(user))
+
+    def _flush(self, key):
+        batch = self._buffers.pop(key, None)
+        if batch:
+            self._submit(self._create_batch(self.registry.get(key), batch))
+
+    def _create_survey(self, survey):
+        name, key = survey.name, survey.key
+        if self.registry.get(key) is not None:
+            self.stats.record('survey_skipped', ok=True, requests=0)
+            return
+        remote = self._remote_match(survey)
+        if remote is not None:
+            if seed_marker(remote)[1] == survey.content_hash():
+                self._survey_reused(survey, remote, 'survey_unchanged')
+                return
+            try:
+                updated = yield call(self.api.update_survey, remote['id'], survey)
+            except Exception as e:
+                log(f"   Warning: failed to update survey '{name}': {e}")
+                self.stats.record('survey_updated', ok=False)
+                return
+            self._survey_reused(survey, updated, 'survey_updated')
+            return
+        attempt = 0
+        while True:
+            try:
+                created = yield call(self.api.create_survey, survey,
+                                     idempotency_key=f"{self.run_id}:survey:{key}")
+                break
+            except Exception as e:
+                error = e
+            wait = None
+            if outcome_unknown(error) and attempt < self.batch_retries:
+                # The server may have created it anyway: look for its marker before sending it again
+                try:
+                    surveys = yield call(self.api.list_surveys)
+                except Exception:
+                    surveys = []
+                self.stats.add('survey_list', requests=1)
+                created = self._find_seeded(survey, surveys)
+                if created is not None:
+                    metrics.count('survey_recovered')
+                    break
+                wait = self.retry_policy.next_delay(attempt, True, stage='survey')
+            if wait is None:
+                log(f"   Warning: failed to create survey '{name}': {error}")
+                self.stats.record('survey', ok=False)
+                return
+            yield call(self._pause, wait, 'survey')
+            attempt += 1
+        self._survey_created(survey, created)
+
+    def _find_seeded(self, survey, surveys):
+        """The server survey this run created for `survey`, found by its marker, or None"""
+        marker = (key_digest(survey.key), survey.content_hash(), survey.run)
+        for remote in surveys:
+            if seed_marker(remote) == marker:
+                return remote
+        return None
+
+    def _survey_created(self, survey, created):
+        self.stats.record('survey', ok=True)
+        self._register(survey, created)
+        log(f"   Created survey: {created['id']} ({survey.name})")
+
+    def _survey_reused(self, survey, data, kind):
+        self.stats.record(kind, ok=True, requests=int(kind == 'survey_updated'))
+        self._reused.add(survey.key)
+        self._register(survey, data)
+        if kind == 'survey_updated':
+            log(f"   Updated survey: {data['id']} ({survey.name})")
+
+    def _register(self, survey, data):
+        entry = SurveyEntry(survey.key, data['id'], survey.name,
+                            [q['id'] for q in data.get('questions', [])])
+        self.registry.add(entry)
+        if self.journal:
+            self.journal.survey_created(survey.key, entry.id, survey.name, list(entry.question_ids))
+
+    def _remote_index(self, surveys):
+        """Key digest -> server survey, for the surveys a seeder created"""
+        self.stats.add('survey_list', requests=1)
+        index = {}
+        for remote in surveys:
+            marker = seed_marker(remote)
+            if marker is not None:
+                index.setdefault(marker[0], remote)
+        log(f"   Delta: {len(index)} seeded surveys found on the server")
+        return index
+
+    def _remote_match(self, survey):
+        if self._remote is None:
+            return None
+        digest = key_digest(survey.key)
+        with self._lock:
+            self._matched.add(digest)
+        return self._remote.get(digest)
+
+    def _report_stale(self):
+        if self._remote is None:
+            return
+        stale = len(set(self._remote) - self._matched)
+        if stale:
+            log(f"   Delta: {stale} seeded surveys on the server are not in the data; left as they are")
+
+    def _create_batch(self, survey, batch):
+        """Send one batch, re-driving only the items that provably never reached the server"""
+        pending, invalid = [], []
+        for index, resp_data in batch:
+            # One malformed response must not take the rest of its batch down with it
+            try:
+                pending.append((index, survey.map_response(resp_data['responses'])))
+            except (KeyError, TypeError, ValueError) as e:
+                invalid.append((index, SchemaError(f"response {index}: invalid answers ({e!r})")))
+        failed = []
+        requests = 0
+        for attempt in range(self.batch_retries + 1 if pending else 0):
+            requests += len(pending)
+            results = yield call(
+                self.api.create_responses, survey.id, [payload for _, payload in pending],
+                [f"{self.run_id}:response:{survey.key}:{index}" for index, _ in pending])
+            errors = dict(results)
+            if self.journal:
+                self.journal.responses_created(
+                    survey.key, [index for position, (index, _) in enumerate(pending)
+                                    if position not in errors])
+            # A response whose outcome is unknown may already be stored, and sending
+            # it again could duplicate it, so only provably unsent ones are re-driven
+            retry = []
+            for position, error in results:
+                if was_unsent(error) and attempt < self.batch_retries:
+                    retry.append((pending[position], error))
+                else:
+                    failed.append((pending[position][0], error))
+            if not retry:
+                break
+            wait = self.retry_policy.next_delay(attempt, True, stage='response_batch')
+            if wait is None:
+                failed.extend((item[0], error) for item, error in retry)
+                break
+            yield call(self._pause, wait, 'response_batch')
+            pending = [item for item, _ in retry]
+
+        failures = invalid + failed
+        self.stats.add('response', created=len(batch) - len(failures), failed=len(failures),
+                       requests=requests)
+        self.stats.record('batch', ok=not failures, requests=0)
+        if failures:
+            log(f"   Warning: {len(failures)}/{len(batch)} responses failed for "
+                  f"'{survey.name}': {failures[0][1]}")
+
+    def _invite_user(self, user):
+        if self.journal and user['email'] in self.journal.invites:
+            self.stats.record('user_skipped', ok=True, requests=0)
+            return
+        attempt = 0
+        while True:
+            try:
+                result = yield call(self.api.invite_user, user['email'], user['name'], user['role'],
+                                    idempotency_key=f"{self.run_id}:user:{user['email']}")
+                break
+            except Exception as e:
+                error = e
+            # Re-inviting is safe: an invite that did go through comes back as a 409.
+            # Unsent ones were already retried by the transport under the same policy
+            retryable = outcome_unknown(error) and attempt < self.batch_retries
+            wait = self.retry_policy.next_delay(attempt, retryable, stage='invite')
+            if wait is None:
+                log(f"   Warning: failed to invite {user['email']}: {error}")
+                self.stats.record('user', ok=False)
+                return
+            yield call(self._pause, wait, 'invite')
+            attempt += 1
+        self._user_invited(user, result)
+
+    def _user_invited(self, user, result):
+        if self.journal:
+            self.journal.user_invited(user['email'])
+        kind = 'user_existing' if result.get('status') == 'already_exists' else 'user'
+        self.stats.record(kind, ok=True)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Append-only on-disk journal of completed seeding work"""
+import json
+import os
+import threading
+import uuid
+
+DEFAULT_JOURNAL = 'data/seed_journal.jsonl'
+
+
+def _records(path):
+    """Every record in the journal at `path`, skipping torn lines"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+class SeedJournal:
+    """Record every created survey, response batch and invite as one JSON line.
+
+    Lines are flushed as they are written, so a crash or Ctrl-C loses at most
+    the requests that were in flight. A torn final line is ignored on load.
+    Runs are appended after one another, each starting with a 'run' record;
+    `resume` continues the latest run, and earlier runs stay on file so
+    `formbricks purge` can still find their surveys.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL, resume=False):
+        self.path = path
+        self.surveys = {}
+        self.responses = {}
+        self.invites = set()
+        self.run_id = None
+        if resume and os.path.exists(path):
+            self._load()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        if self.run_id is None:
+            # Idempotency keys derive from the run ID, so a resumed run keeps its keys
+            self.run_id = uuid.uuid4().hex
+            self._append({'kind': 'run', 'id': self.run_id})
+
+    def _load(self):
+        for record in _records(self.path):
+            kind = record.get('kind')
+            if kind == 'survey':
+                self.surveys[record['key']] = record
+            elif kind == 'responses':
+                self.responses.setdefault(record['survey'], set()).update(record['indices'])
+            elif kind == 'invite':
+                self.invites.add(record['email'])
+            elif kind == 'run':
+                # Only the latest run is resumed
+                self.run_id = record['id']
+                self.surveys, self.responses, self.invites = {}, {}, set()
+
+    def _append(self, record):
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def survey_created(self, key, survey_id, name, question_ids):
+        record = {'kind': 'survey', 'key': key, 'id': survey_id, 'name': name,
+                  'question_ids': question_ids}
+        self._append(record)
+
+    def responses_created(self, survey_key, indices):
+        if indices:
+            self._append({'kind': 'responses', 'survey': survey_key, 'indices': indices})
+
+    def user_invited(self, email):
+        self._append({'kind': 'invite', 'email': email})
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def recorded_survey_ids(path):
+    """IDs of the surveys created by every run recorded in the journal at `path`"""
+    if not os.path.exists(path):
+        return []
+    return [record['id'] for record in _records(path) if record.get('kind') == 'survey']
+
+
+def prune_surveys(path, survey_ids):
+    """Rewrite the journal at `path` without the surveys in `survey_ids` and their responses"""
+    if not os.path.exists(path):
+        return
+    run, doomed = None, set()
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for record in _records(path):
+            kind = record.get('kind')
+            if kind == 'run':
+                run = record['id']
+            elif kind == 'survey' and record.get('id') in survey_ids:
+                # Keys repeat across runs, so a survey is identified by its run and key
+                doomed.add((run, record['key']))
+                continue
+            elif kind == 'responses' and (run, record['survey']) in doomed:
+                continue
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    os.replace(tmp, path)
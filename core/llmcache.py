@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Content-addressed SQLite cache for LLM generations"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE = '.cache/llm_cache.sqlite'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(provider, model, prompt, temperature=None, seed=None):
+    """Hash of everything that determines a generation"""
+    material = json.dumps([provider, model, prompt, temperature, seed], separators=(',', ':'))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """Store parsed LLM results keyed by cache_key(), evicting least recently used entries.
+
+    With `refresh` set, lookups always miss but fresh results are still stored.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE, max_bytes=DEFAULT_MAX_BYTES, refresh=False):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, '
+            'last_access REAL NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)')
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def get(self, key):
+        """Return the cached value for `key`, or None"""
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._db.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute('UPDATE entries SET last_access = ? WHERE key = ?', (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        text = json.dumps(value, separators=(',', ':'))
+        size = len(text.encode('utf-8'))
+        with self._lock:
+            old = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                             (key, text, size, time.time()))
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits again"""
+        rows = self._db.execute('SELECT key, size FROM entries ORDER BY last_access').fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._size <= self.max_bytes:
+                break
+            doomed.append((key,))
+            self._size -= size
+        self._db.executemany('DELETE FROM entries WHERE key = ?', doomed)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Per-stage timers and counters for the CLI commands.
+
+Instrumentation is off by default and every hook returns after a single
+flag check, so hot paths can call it unconditionally. Once enable() is
+called, timings are aggregated into fixed histogram buckets per
+(stage, labels) pair. They can be printed as a summary table or written as
+Prometheus / OpenMetrics text.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Upper bounds in seconds; the last bucket catches everything slower
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+           60.0, 120.0, float('inf'))
+PREFIX = 'formbricks_cli'
+
+_enabled = False
+_lock = threading.Lock()
+_timers = {}
+_counters = {}
+
+
+class _Timing:
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile"""
+        rank, seen = q * self.count, 0
+        for bound, hits in zip(BUCKETS, self.buckets):
+            seen += hits
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+def _key(name, labels):
+    return (name, tuple(sorted(labels.items()))) if labels else (name, ())
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def observe(name, seconds, **labels):
+    """Record one duration for stage `name`"""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        timing = _timers.get(key)
+        if timing is None:
+            timing = _timers[key] = _Timing()
+        timing.add(seconds)
+
+
+def count(name, value=1, **labels):
+    """Add `value` to counter `name`"""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+@contextmanager
+def _timed(name, labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name, **labels):
+    """Context manager timing one stage; a shared no-op when metrics are disabled"""
+    if not _enabled:
+        return _NULL_TIMER
+    return _timed(name, labels)
+
+
+def _number(value):
+    """Counter value as text: integers in full, anything else as repr(float)"""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _label_text(labels):
+    return ' '.join(f"{k}={v}" for k, v in labels)
+
+
+def summary():
+    """Printable per-stage table of everything recorded so far"""
+    with _lock:
+        timers = sorted(_timers.items())
+        counters = sorted(_counters.items())
+    if not timers and not counters:
+        return "No metrics recorded"
+
+    lines = []
+    if timers:
+        rows = [(name + (' ' + _label_text(labels) if labels else ''), t) for (name, labels), t in timers]
+        width = max(24, max(len(label) for label, _ in rows))
+        lines.append(f"{'Stage':<{width}} {'Count':>8} {'Total s':>9} {'Mean ms':>9} "
+                     f"{'p95 ms':>9} {'Max ms':>9}")
+        for label, t in rows:
+            lines.append(f"{label:<{width}} {t.count:>8} {t.total:>9.2f} "
+                         f"{t.total / t.count * 1000:>9.2f} {t.quantile(0.95) * 1000:>9.2f} "
+                         f"{t.max * 1000:>9.2f}")
+    if counters:
+        rows = [(name + (' ' + _label_text(labels) if labels else ''), v) for (name, labels), v in counters]
+        width = max(24, max(len(label) for label, _ in rows))
+        if lines:
+            lines.append('')
+        lines.append(f"{'Counter':<{width}} {'Value':>8}")
+        for label, value in rows:
+            lines.append(f"{label:<{width}} {_number(value):>8}")
+    return '\n'.join(lines)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def exposition(openmetrics=False):
+    """Prometheus text exposition (or OpenMetrics with `openmetrics`) of all metrics"""
+    with _lock:
+        timers = sorted(_timers.items())
+        counters = sorted(_counters.items())
+
+    family = f"{PREFIX}_stage_seconds"
+    lines = [f"# HELP {family} Time spent per CLI stage.", f"# TYPE {family} histogram"]
+    for (name, labels), t in timers:
+        base = (('stage', name),) + labels
+        cumulative = 0
+        for bound, hits in zip(BUCKETS, t.buckets):
+            cumulative += hits
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            lines.append(f"{family}_bucket{_labels(base + (('le', le),))} {cumulative}")
+        lines.append(f"{family}_count{_labels(base)} {t.count}")
+        lines.append(f"{family}_sum{_labels(base)} {t.total!r}")
+
+    family = f"{PREFIX}_events"
+    # Prometheus text names the counter family with its _total suffix, OpenMetrics without it
+    declared = family if openmetrics else family + '_total'
+    lines.append(f"# HELP {declared} CLI event counters.")
+    lines.append(f"# TYPE {declared} counter")
+    for (name, labels), value in counters:
+        lines.append(f"{family}_total{_labels((('event', name),) + labels)} {_number(value)}")
+    if openmetrics:
+        lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
+
+
+def write(path, openmetrics=False):
+    with open(path, 'w') as f:
+        f.write(exposition(openmetrics))
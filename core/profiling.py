@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""cProfile, wall-clock stack sampling and tracemalloc around a CLI command"""
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+DEFAULT_PROFILE_DIR = 'profiles'
+DEFAULT_INTERVAL = 0.005
+
+
+def default_prefix(command):
+    """profiles/<command>-<timestamp>, used when no --profile-output is given"""
+    return os.path.join(DEFAULT_PROFILE_DIR, f"{command or 'cli'}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Sample the stacks of every thread at a fixed wall-clock interval.
+
+    Unlike cProfile this sees worker threads too, and its overhead does not
+    grow with the number of function calls. Stacks are counted in
+    collapsed form (`thread;outer;...;inner`), ready for flamegraph.pl,
+    speedscope or inferno.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = 0
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            # Pool workers are named Executor-N_M; fold them into one flame per pool
+            names = {t.ident: re.sub(r'_\d+$', '', t.name) for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, 'thread'))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            for stack, hits in self.stacks.most_common():
+                f.write(f"{stack} {hits}\n")
+
+    def top(self, limit=15):
+        """(frame, samples) for the innermost frames seen most often"""
+        leaves = Counter()
+        for stack, hits in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += hits
+        return leaves.most_common(limit)
+
+
+def _prepare(prefix):
+    os.makedirs(os.path.dirname(prefix) or '.', exist_ok=True)
+
+
+@contextmanager
+def profiled(mode=None, prefix=None, trace_allocations=False, interval=None, top=20):
+    """Run the body under `mode` ('cprofile' or 'sample') and/or tracemalloc.
+
+    Results are written next to `prefix`: `.prof` for cProfile (open with
+    snakeviz or pstats), `.collapsed` for the sampler and `.tracemalloc` for
+    the allocation snapshot. A short report is printed when the body ends,
+    including when it exits through sys.exit().
+    """
+    if not mode and not trace_allocations:
+        yield
+        return
+
+    _prepare(prefix)
+    interval = interval or DEFAULT_INTERVAL
+    profiler = sampler = None
+    if trace_allocations:
+        tracemalloc.start(25)
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == 'sample':
+        sampler = StackSampler(interval)
+        sampler.start()
+    try:
+        yield
+    finally:
+        # Snapshot before reporting so the reports' own allocations are not counted
+        snapshot = None
+        if trace_allocations:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if profiler is not None:
+            profiler.disable()
+            path = f"{prefix}.prof"
+            profiler.dump_stats(path)
+            print(f"\nProfile (main thread, top {top} by cumulative time), saved to {path}:")
+            pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
+        if sampler is not None:
+            sampler.stop()
+            path = f"{prefix}.collapsed"
+            sampler.write_collapsed(path)
+            print(f"\nSampled {sampler.samples} times every {interval * 1000:g}ms; "
+                  f"collapsed stacks saved to {path}")
+            total = sum(sampler.stacks.values()) or 1
+            for frame, hits in sampler.top(top):
+                print(f"   {hits / total:>6.1%}  {frame}")
+        if snapshot is not None:
+            path = f"{prefix}.tracemalloc"
+            snapshot.dump(path)
+            print(f"\nAllocations: {current / 1e6:.1f} MB live, {peak / 1e6:.1f} MB peak; "
+                  f"snapshot saved to {path}")
+            for stat in snapshot.statistics('lineno')[:top]:
+                print(f"   {stat}")
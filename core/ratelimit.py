@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Token-bucket rate limiting with AIMD adaptation"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _take(self):
+        """Take a token if one is available; otherwise return how long to wait for one"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available and return the time spent waiting"""
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self):
+        """acquire() for coroutines: waits without blocking the event loop"""
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if not delay:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket whose rate follows additive-increase/multiplicative-decrease.
+
+    Until the first slowdown signal the limiter is in slow start and every
+    healthy response raises the rate by one request per second, doubling it
+    roughly every second. After that, healthy responses nudge the rate up by
+    about `increase` requests per second per second of traffic; a 429, a connection failure or a
+    response slower than `latency_target` cuts the rate by `decrease`. Cuts are spaced at least
+    `cooldown` seconds apart so one burst of in-flight failures only counts once.
+    """
+
+    def __init__(self, rate, min_rate=1.0, max_rate=None, increase=1.0,
+                 decrease=0.5, latency_target=1.0, cooldown=1.0):
+        super().__init__(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate) if max_rate else self.rate * 10
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.latency_target = float(latency_target)
+        self.cooldown = float(cooldown)
+        self._last_cut = 0.0
+        self._slow_start = True
+
+    def record(self, status_code, latency):
+        """Feed back the outcome of one request"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if status_code is None or status_code == 429 or latency > self.latency_target:
+                if now - self._last_cut >= self.cooldown:
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self._tokens = min(self._tokens, 1.0)
+                    self._last_cut = now
+                    self._slow_start = False
+            elif status_code is not None and status_code < 500:
+                step = 1.0 if self._slow_start else self.increase / self.rate
+                self.rate = min(self.max_rate, self.rate + step)
+            self.burst = max(1.0, self.rate)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Event-driven readiness detection for the Docker Compose stack.
+
+Three signals are combined, and whichever sees the stack ready first wins:
+
+- `docker compose events` reports container starts and healthcheck results
+  as they happen.
+- `docker compose logs -f` is watched for the server's "ready" line.
+- HTTP probes of /api/health back off exponentially from a few
+  milliseconds. Any event from the other two signals wakes the prober, which
+  then probes at once and restarts its backoff.
+
+Every first occurrence of a signal is recorded on a timeline for the
+summary printed by `formbricks up`.
+"""
+import json
+import re
+import subprocess
+import threading
+import time
+
+import requests
+
+from core import metrics
+from core.transport import Transport
+
+COMPOSE = ('docker', 'compose')
+SERVICES = ('postgres', 'formbricks')
+APP_SERVICE = 'formbricks'
+HEALTH_PATH = '/api/health'
+
+# Next.js and Node server start-up lines
+READY_LINE = re.compile(r'Ready in|ready - started server|Listening on|started server on', re.I)
+
+
+class Timeline:
+    """First time each (service, event) pair was seen, relative to start"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.events = []
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def record(self, service, event):
+        """Record `event` once; return True if it is new"""
+        with self._lock:
+            if (service, event) in self._seen:
+                return False
+            self._seen.add((service, event))
+            self.events.append((time.monotonic() - self.started, service, event))
+            return True
+
+    def format(self):
+        width = max([len(service) for _, service, _ in self.events] + [8])
+        lines = []
+        for offset, service, event in sorted(self.events):
+            stamp = f"+{offset:.2f}s"
+            lines.append(f"   {stamp:>8}  {service:<{width}}  {event}")
+        return '\n'.join(lines)
+
+
+class Readiness:
+    """Watch the compose stack and an HTTP health endpoint until the app is ready.
+
+    Call start() before `docker compose up` so no container event is
+    missed, watch_logs() once the containers exist, then wait().
+    """
+
+    def __init__(self, base_url, compose=COMPOSE, services=SERVICES, app_service=APP_SERVICE,
+                 initial_delay=0.01, max_delay=2.0, probe_timeout=2.0):
+        self.base_url = base_url
+        self.compose = list(compose)
+        self.services = services
+        self.app_service = app_service
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.probe_timeout = probe_timeout
+        self.timeline = Timeline()
+        # Log lines from before this run belong to an earlier container
+        self.since = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        self.ready = threading.Event()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._processes = []
+        self._threads = []
+
+    def _spawn(self, name, target, *args):
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _ready(self, service, event):
+        self.timeline.record(service, event)
+        self.ready.set()
+        self._wake.set()
+
+    def _stream(self, args):
+        """Yield the output lines of a long-running docker command until stopped"""
+        try:
+            process = subprocess.Popen(self.compose + args, stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        except OSError:
+            return
+        self._processes.append(process)
+        try:
+            for line in process.stdout:
+                if self._stop.is_set():
+                    break
+                yield line
+        finally:
+            if process.poll() is None:
+                process.terminate()
+
+    def _watch_events(self):
+        for line in self._stream(['events', '--json'] + list(self.services)):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            service, action = event.get('service'), event.get('action', '')
+            if action == 'start':
+                self.timeline.record(service, 'container started')
+            elif action.startswith('health_status'):
+                status = action.split(':', 1)[-1].strip()
+                self.timeline.record(service, status)
+                if status == 'healthy' and service == self.app_service:
+                    self._ready(service, 'ready (compose healthcheck)')
+            self._wake.set()
+
+    def _watch_log(self):
+        for line in self._stream(['logs', '--follow', '--no-color', '--no-log-prefix',
+                                  '--since', self.since, self.app_service]):
+            if READY_LINE.search(line):
+                self.timeline.record(self.app_service, f"log: {line.strip()[:60]}")
+                self._wake.set()
+                return
+
+    def _probe(self):
+        transport = Transport(self.base_url, pool_size=1)
+        delay = self.initial_delay
+        try:
+            while not self._stop.is_set() and not self.ready.is_set():
+                metrics.count('health_probe')
+                try:
+                    status = transport.get(HEALTH_PATH, timeout=self.probe_timeout).status_code
+                except requests.exceptions.RequestException:
+                    status = None
+                else:
+                    self.timeline.record(self.app_service, 'HTTP accepting connections')
+                if status == 200:
+                    self._ready(self.app_service, f"ready (HTTP {HEALTH_PATH} 200)")
+                    return
+                # A compose or log event means something changed: probe again right away
+                with metrics.timer('sleep', reason='health_backoff'):
+                    woken = self._wake.wait(delay)
+                if woken:
+                    self._wake.clear()
+                    delay = self.initial_delay
+                else:
+                    delay = min(delay * 2, self.max_delay)
+        finally:
+            transport.close()
+
+    def snapshot(self):
+        """Record the current compose state, catching anything that happened before start()"""
+        try:
+            output = subprocess.run(self.compose + ['ps', '--format', 'json'], capture_output=True,
+                                    text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            return
+        output = output.strip()
+        try:
+            if output.startswith('['):
+                containers = json.loads(output)
+            else:
+                # Newer compose releases print one JSON object per line
+                containers = [json.loads(line) for line in output.splitlines() if line.strip()]
+        except ValueError:
+            return
+        for container in containers:
+            service, health = container.get('Service'), container.get('Health')
+            if container.get('State') == 'running':
+                self.timeline.record(service, 'container started')
+            if health:
+                self.timeline.record(service, health)
+                if health == 'healthy' and service == self.app_service:
+                    self._ready(service, 'ready (compose healthcheck)')
+
+    def start(self):
+        self._spawn('readiness-events', self._watch_events)
+        self._spawn('readiness-probe', self._probe)
+
+    def watch_logs(self):
+        self.timeline.record('stack', 'docker compose up returned')
+        self.snapshot()
+        self._spawn('readiness-logs', self._watch_log)
+        self._wake.set()
+
+    def wait(self, timeout=180):
+        """Block until the app is ready or `timeout` passes; return whether it is ready"""
+        ready = self.ready.wait(timeout)
+        self.stop()
+        return ready
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        for process in self._processes:
+            if process.poll() is None:
+                process.terminate()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Index of created surveys keyed by their generation-time key"""
+import json
+import os
+import threading
+
+DEFAULT_REGISTRY = 'data/survey_registry.json'
+
+
+class SurveyEntry:
+    """A created survey and its question IDs in generation order"""
+
+    __slots__ = ('key', 'id', 'name', 'question_ids')
+
+    def __init__(self, key, id, name, question_ids):
+        self.key = key
+        self.id = id
+        self.name = name
+        self.question_ids = tuple(question_ids)
+
+    def map_response(self, answers):
+        """Attach question IDs to a generated response's answers, by position"""
+        return {'responses': [{'questionId': qid, 'value': answer['value']}
+                              for qid, answer in zip(self.question_ids, answers)]}
+
+    def to_dict(self):
+        return {'key': self.key, 'id': self.id, 'name': self.name,
+                'question_ids': list(self.question_ids)}
+
+
+class SurveyRegistry:
+    """Thread-safe key -> SurveyEntry index with a name index for legacy data.
+
+    Legacy response records only carry a survey name; they resolve by name
+    only when exactly one registered survey has that name, so surveys that
+    share a name are never mixed up.
+    """
+
+    def __init__(self):
+        self._by_key = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+
+    def add(self, entry):
+        with self._lock:
+            previous = self._by_key.get(entry.key)
+            if previous is not None:
+                self._by_name[previous.name].discard(entry.key)
+            self._by_key[entry.key] = entry
+            self._by_name.setdefault(entry.name, set()).add(entry.key)
+
+    def update(self, other):
+        """Add every entry of `other`, replacing entries with the same key"""
+        for entry in other:
+            self.add(entry)
+
+    def get(self, key):
+        return self._by_key.get(key)
+
+    def resolve(self, survey_key=None, survey_name=None):
+        """Find a survey by key, falling back to an unambiguous name"""
+        if survey_key:
+            return self._by_key.get(survey_key)
+        keys = self._by_name.get(survey_name, ())
+        if len(keys) == 1:
+            return self._by_key[next(iter(keys))]
+        return None
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def __iter__(self):
+        return iter(list(self._by_key.values()))
+
+    @classmethod
+    def from_records(cls, records):
+        registry = cls()
+        for record in records:
+            registry.add(SurveyEntry(record['key'], record['id'], record['name'],
+                                     record.get('question_ids', ())))
+        return registry
+
+    @classmethod
+    def load(cls, path=DEFAULT_REGISTRY):
+        """Load a saved registry, or return an empty one"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding='utf-8') as f:
+            return cls.from_records(json.load(f).get('surveys', []))
+
+    def save(self, path=DEFAULT_REGISTRY):
+        """Atomically write the registry so later runs can reuse it"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'surveys': [entry.to_dict() for entry in self]}, f)
+        os.replace(tmp, path)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Retry policy shared by the Formbricks API and LLM clients.
+
+Failures are classified as retryable or fatal. Timeouts, connection errors,
+429 and 5xx responses are retried; anything else is returned or raised at
+once. Formbricks does not deduplicate by Idempotency-Key, so a POST is only
+retried when the failure proves the server never acted on it. Retries wait
+with full-jitter exponential backoff, or for as long as the server's
+Retry-After header asks. Every retry also draws from a per-run RetryBudget,
+so a dead server cannot multiply the work of a whole run by the number of
+attempts.
+"""
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from core import metrics
+
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+
+# Responses that guarantee the server did not act on the request
+UNSENT_STATUS = frozenset({429})
+
+
+def request_unsent(error):
+    """True if a requests exception proves the request never reached the server.
+
+    That is a connect timeout, or a connection that was refused or could not
+    be opened (requests wraps urllib3's NewConnectionError in a ConnectionError).
+    Even a non-idempotent POST can then be repeated without creating anything
+    twice. AsyncTransport treats aiohttp's ClientConnectorError the same way.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    return False
+
+
+def was_unsent(error):
+    """True if a failed API call provably never reached the server, so it may be sent again.
+
+    Transports tag the connection errors they raise with `unsent`; HTTP
+    errors carry the response.
+    """
+    unsent = getattr(error, 'unsent', None)
+    if unsent is not None:
+        return unsent
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code in UNSENT_STATUS
+
+
+def outcome_unknown(error):
+    """True if a failed API call may still have been carried out by the server"""
+    unsent = getattr(error, 'unsent', None)
+    if unsent is not None:
+        return not unsent
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code >= 500
+
+
+class RetryBudget:
+    """Thread-safe cap on the number of retries in one run (0 = unlimited)"""
+
+    def __init__(self, max_retries=0):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self):
+        with self._lock:
+            if self.max_retries and self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def exhausted(self):
+        return bool(self.max_retries) and self.used >= self.max_retries
+
+
+def retry_after(headers):
+    """Seconds requested by a Retry-After header, or None"""
+    value = (headers or {}).get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_status(status, headers=None, idempotent=True):
+    """Return (retryable, retry_after seconds) for an HTTP status code"""
+    if status not in RETRYABLE_STATUS:
+        return False, None
+    return idempotent or status in UNSENT_STATUS, retry_after(headers)
+
+
+def classify_http(response=None, error=None, idempotent=True):
+    """Return (retryable, retry_after seconds) for one requests attempt.
+
+    Non-idempotent requests are only retried when the failure proves the
+    server did not act on them.
+    """
+    if error is not None:
+        if not isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return False, None
+        return idempotent or request_unsent(error), None
+    return classify_status(response.status_code, response.headers, idempotent)
+
+
+class RetryPolicy:
+    """Up to `attempts` tries with full-jitter exponential backoff.
+
+    The n-th retry waits a random time between 0 and
+    min(max_delay, base_delay * 2**n), unless the server sent Retry-After,
+    which is honoured up to `max_retry_after` seconds.
+    """
+
+    def __init__(self, attempts=4, base_delay=0.2, max_delay=10.0, max_retry_after=60.0,
+                 budget=None):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self._random = random.Random()
+
+    def delay(self, retry, server_delay=None):
+        if server_delay is not None:
+            return min(server_delay, self.max_retry_after)
+        return self._random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def next_delay(self, attempt, retryable, server_delay=None, stage='http'):
+        """Seconds to wait before attempt `attempt` + 1, or None to give up"""
+        if not retryable or attempt + 1 >= self.attempts or not self.budget.take():
+            return None
+        metrics.count('retry', stage=stage)
+        return self.delay(attempt, server_delay)
+
+    def sleep(self, seconds, stage='http'):
+        with metrics.timer('sleep', reason='retry', stage=stage):
+            time.sleep(seconds)
+
+    async def sleep_async(self, seconds, stage='http'):
+        with metrics.timer('sleep', reason='retry', stage=stage):
+            await asyncio.sleep(seconds)
+
+    def call(self, fn, classify, stage='call'):
+        """Call fn() until it succeeds or classify(error) says the error is fatal.
+
+        `classify` maps an exception to (retryable, retry_after seconds).
+        """
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                retryable, server_delay = classify(e)
+                wait = self.next_delay(attempt, retryable, server_delay, stage)
+                if wait is None:
+                    raise
+            self.sleep(wait, stage)
+            attempt += 1
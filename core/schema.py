@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Typed survey models and a precompiled Management API payload builder.
+
+Generated surveys are validated once into slotted Survey/Question objects,
+so malformed data is rejected before any network I/O. Payloads reuse shared
+template fragments instead of rebuilding the same nested dicts per question.
+Every payload is tagged with a hidden-field marker holding the survey key's
+digest, a content hash and the seeding run, which identifies seeded surveys
+on the server.
+"""
+import hashlib
+import json
+
+from core.encoding import encode_json
+
+QUESTION_TYPES = frozenset(['openText', 'multipleChoiceSingle', 'multipleChoiceMulti', 'nps',
+                            'rating', 'cta'])
+CHOICE_TYPES = frozenset(['multipleChoiceSingle', 'multipleChoiceMulti'])
+RATING_RANGES = frozenset([3, 4, 5, 6, 7, 10])
+SURVEY_TYPES = frozenset(['link', 'app', 'website'])
+
+# Hidden field ID that tags a survey as seeded: fbseed_<key digest>_<content hash>_<run digest>
+SEED_MARKER = 'fbseed'
+
+# Shared fragments; payloads are only ever serialized, never mutated
+_EMPTY_SUBHEADER = {'default': ''}
+_LOWER_LABEL = {'default': 'Not likely'}
+_UPPER_LABEL = {'default': 'Very likely'}
+_WELCOME_DISABLED = {'enabled': False}
+_THANK_YOU_CARD = {
+    'enabled': True,
+    'headline': {'default': 'Thank you!'},
+    'subheader': {'default': 'We appreciate your feedback.'}
+}
+
+
+class SchemaError(ValueError):
+    """Raised when generated survey data does not match the survey schema"""
+
+
+class Question:
+    __slots__ = ('type', 'headline', 'required', 'choices', 'range', 'button_label',
+                 'dismiss_button_label')
+
+    def __init__(self, type, headline, required=False, choices=None, range=None,
+                 button_label='Next', dismiss_button_label='Skip'):
+        self.type = type
+        self.headline = headline
+        self.required = required
+        self.choices = choices
+        self.range = range
+        self.button_label = button_label
+        self.dismiss_button_label = dismiss_button_label
+
+    @classmethod
+    def from_record(cls, data, where):
+        qtype = data.get('type')
+        if qtype not in QUESTION_TYPES:
+            raise SchemaError(f"{where}: unknown question type {qtype!r}")
+        headline = data.get('headline') or data.get('text')
+        if not headline:
+            raise SchemaError(f"{where}: missing headline")
+        choices = None
+        if qtype in CHOICE_TYPES:
+            choices = data.get('choices') or []
+            if len(choices) < 2 or not all(isinstance(c, str) and c for c in choices):
+                raise SchemaError(f"{where}: {qtype} needs at least two non-empty choices")
+        scale = None
+        if qtype == 'rating':
+            scale = data.get('range', 5)
+            if scale not in RATING_RANGES:
+                raise SchemaError(f"{where}: rating range must be one of {sorted(RATING_RANGES)}")
+        return cls(qtype, headline, bool(data.get('required', False)), choices, scale,
+                   data.get('buttonLabel', 'Next'), data.get('dismissButtonLabel', 'Skip'))
+
+    def payload(self):
+        question = {
+            'type': self.type,
+            'headline': {'default': self.headline},
+            'required': self.required,
+            'subheader': _EMPTY_SUBHEADER
+        }
+        if self.choices is not None:
+            question['choices'] = [{'id': f"choice_{j}", 'label': {'default': choice}}
+                                   for j, choice in enumerate(self.choices)]
+            question['shuffleOption'] = 'none'
+        elif self.type == 'rating':
+            question['scale'] = 'number'
+            question['range'] = self.range
+            question['lowerLabel'] = _LOWER_LABEL
+            question['upperLabel'] = _UPPER_LABEL
+        elif self.type == 'nps':
+            question['lowerLabel'] = _LOWER_LABEL
+            question['upperLabel'] = _UPPER_LABEL
+        elif self.type == 'cta':
+            question['buttonLabel'] = {'default': self.button_label}
+            question['dismissButtonLabel'] = {'default': self.dismiss_button_label}
+        return question
+
+
+class Survey:
+    __slots__ = ('key', 'name', 'type', 'description', 'questions', 'run', '_compiled', '_encoded')
+
+    def __init__(self, key, name, type, description, questions, run=None):
+        self.key = key
+        self.name = name
+        self.type = type
+        self.description = description
+        self.questions = questions
+        # Digest of the seeding run that sends this survey, recorded in its marker
+        self.run = run
+        self._compiled = None
+        self._encoded = None
+
+    @classmethod
+    def from_record(cls, data):
+        """Validate a generated survey record"""
+        name = data.get('name') or data.get('title')
+        if not name:
+            raise SchemaError("survey is missing a name")
+        survey_type = data.get('type', 'link')
+        if survey_type not in SURVEY_TYPES:
+            raise SchemaError(f"survey '{name}': unknown survey type {survey_type!r}")
+        raw_questions = data.get('questions')
+        if not raw_questions:
+            raise SchemaError(f"survey '{name}': has no questions")
+        questions = [Question.from_record(q, f"survey '{name}' question {i + 1}")
+                     for i, q in enumerate(raw_questions)]
+        return cls(data.get('key') or name, name, survey_type, data.get('description'), questions)
+
+    def _compile(self):
+        """The payload without its marker, and its content hash, built on first use"""
+        if self._compiled is None:
+            welcome = _WELCOME_DISABLED
+            if self.description:
+                welcome = {
+                    'enabled': True,
+                    'headline': {'default': self.name},
+                    'subheader': {'default': self.description}
+                }
+            body = {
+                'name': self.name,
+                'type': self.type,
+                'status': 'inProgress',
+                'questions': [q.payload() for q in self.questions],
+                'welcomeCard': welcome,
+                'thankYouCard': _THANK_YOU_CARD
+            }
+            self._compiled = body, _digest(body)
+        return self._compiled
+
+    def payload(self):
+        """Management API create-survey payload"""
+        body, content_hash = self._compile()
+        # The marker records what was sent, so later runs can tell changed surveys apart,
+        # and by which run, so a run only ever adopts surveys it created itself
+        marker = f"{SEED_MARKER}_{key_digest(self.key)}_{content_hash}"
+        if self.run:
+            marker += f"_{self.run}"
+        return dict(body, hiddenFields={'enabled': False, 'fieldIds': [marker]})
+
+    def encoded_payload(self):
+        # Keyed by run, which the engine sets after validation
+        if self._encoded is None or self._encoded[0] != self.run:
+            self._encoded = self.run, encode_json(self.payload())
+        return self._encoded[1]
+
+    def content_hash(self):
+        """Hash of everything the payload sets, as stored in the seed marker"""
+        return self._compile()[1]
+
+
+def _digest(value):
+    # Sorted, fixed-format JSON so the hash does not depend on the encoder in use
+    material = json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]
+
+
+def key_digest(key):
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def seed_marker(survey):
+    """(key digest, content hash, run digest) from a survey payload or API survey.
+
+    Returns None if the survey was not seeded; the run digest is None for
+    markers written before runs were recorded.
+    """
+    for field_id in (survey.get('hiddenFields') or {}).get('fieldIds') or ():
+        parts = field_id.split('_')
+        if len(parts) in (3, 4) and parts[0] == SEED_MARKER:
+            return parts[1], parts[2], parts[3] if len(parts) == 4 else None
+    return None
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Multi-process synthetic generation into shard files joined by a manifest"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from core.datafile import RecordWriter
+from core.synthetic import plan_shards, shard_records
+
+
+def _shard_path(output, shard):
+    """Shard files live next to the manifest and reuse its compression suffix"""
+    base = os.path.basename(output)
+    suffix = ''
+    for ext in ('.gz', '.zst'):
+        if base.endswith(ext):
+            base, suffix = base[:-len(ext)], ext
+    return os.path.join(f"{base}.shards", f"shard-{shard:05d}.jsonl{suffix}")
+
+
+def _write_shard(job):
+    output, seed, shard, options = job
+    relative = _shard_path(output, shard[0])
+    path = os.path.join(os.path.dirname(output) or '.', relative)
+    with RecordWriter(path) as writer:
+        for record in shard_records(seed, *shard, **options):
+            writer.write(record)
+    return relative, {kind: count for kind, count in writer.counts.items() if count}
+
+
+def generate_sharded(output, workers, seed=42, surveys=5, users=10, shard_size=100, **options):
+    """Write every shard in a process pool, then a manifest of shard references.
+
+    The manifest is itself a record file of `shard` records, which
+    read_records() follows lazily, so readers see the exact stream that
+    synthetic_records() would have produced in one process.
+    """
+    plan = plan_shards(surveys, users, shard_size)
+    jobs = [(output, seed, shard, options) for shard in plan]
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(_write_shard, jobs))
+
+    totals = {}
+    with RecordWriter(output) as manifest:
+        for relative, counts in results:
+            manifest.write({'kind': 'shard', 'path': relative, 'counts': counts})
+            for kind, count in counts.items():
+                totals[kind] = totals.get(kind, 0) + count
+    return len(plan), totals
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Deterministic offline generator for surveys, users and typed answers"""
+import random
+from itertools import accumulate
+
+SURVEY_TEMPLATES = [
+    ('Product Feedback', 'Help us improve {product}', [
+        ('rating', 'How satisfied are you with {product}?'),
+        ('multipleChoiceSingle', 'Which feature do you use most?', 'features'),
+        ('openText', 'What should we improve next?'),
+        ('nps', 'How likely are you to recommend {product} to a colleague?'),
+    ]),
+    ('Net Promoter Score', 'A quick pulse check on {product}', [
+        ('nps', 'How likely are you to recommend {product} to a friend?'),
+        ('openText', 'What is the main reason for your score?'),
+        ('multipleChoiceSingle', 'How often do you use {product}?', 'frequency'),
+    ]),
+    ('Feature Request', 'Tell us what {product} is missing', [
+        ('multipleChoiceMulti', 'Which areas need new features?', 'features'),
+        ('rating', 'How important is this request to your team?'),
+        ('openText', 'Describe the feature you would like to see.'),
+        ('cta', 'Want to join our beta program?'),
+    ]),
+    ('User Onboarding', 'How was your first week with {product}?', [
+        ('rating', 'How easy was it to get started?'),
+        ('multipleChoiceSingle', 'How did you hear about {product}?', 'channels'),
+        ('multipleChoiceMulti', 'Which resources did you use?', 'resources'),
+        ('openText', 'What almost stopped you from signing up?'),
+    ]),
+    ('Customer Satisfaction', 'Rate your recent experience with {product}', [
+        ('rating', 'How would you rate our support team?'),
+        ('nps', 'How likely are you to renew your {product} subscription?'),
+        ('multipleChoiceSingle', 'How quickly was your issue resolved?', 'resolution'),
+        ('openText', 'Anything else you would like to share?'),
+        ('cta', 'Would you like to talk to your account manager?'),
+    ]),
+]
+
+PRODUCTS = ['Acme Analytics', 'Nimbus CRM', 'Orbit Mail', 'Pulse Dashboards', 'Quill Docs',
+            'Relay Chat', 'Summit Billing', 'Tidal Storage', 'Vector Search', 'Zenith Tasks']
+
+CHOICES = {
+    'features': ['Dashboards', 'Reports', 'Integrations', 'Mobile app', 'Automation', 'API access'],
+    'frequency': ['Daily', 'Weekly', 'Monthly', 'Rarely'],
+    'channels': ['Search engine', 'Colleague', 'Social media', 'Conference', 'Blog post'],
+    'resources': ['Documentation', 'Video tutorials', 'Live webinar', 'Support chat', 'Community forum'],
+    'resolution': ['Within an hour', 'Same day', 'Within a week', 'Not resolved yet'],
+}
+
+RATING_RANGES = [5, 5, 7, 10]
+
+OPEN_TEXT_CORPUS = [
+    "The onboarding flow was clear and quick.",
+    "Search could be faster on large workspaces.",
+    "I would love a dark mode for late-night work.",
+    "Exporting reports to CSV saves me hours every week.",
+    "The mobile app feels slower than the web version.",
+    "Support answered within minutes, which was great.",
+    "Pricing is a bit steep for small teams.",
+    "Integrations with our calendar would help a lot.",
+    "Notifications are too noisy by default.",
+    "Dashboards are exactly what our managers needed.",
+    "Setting up permissions took longer than expected.",
+    "Keep the interface this simple, it works.",
+]
+
+FIRST_NAMES = ['Alex', 'Priya', 'Jordan', 'Mei', 'Samuel', 'Fatima', 'Lucas', 'Aisha', 'Noah',
+               'Elena', 'Kenji', 'Olivia', 'Mateo', 'Zara', 'Ravi', 'Sofia', 'Daniel', 'Amara']
+LAST_NAMES = ['Patel', 'Nguyen', 'Garcia', 'Smith', 'Kim', 'Okafor', 'Rossi', 'Mueller', 'Silva',
+              'Cohen', 'Tanaka', 'Haddad', 'Johansson', 'Brown', 'Ivanova', 'Mensah']
+COMPANY_DOMAIN = 'example.com'
+
+# Skewed towards promoters, like most real NPS datasets
+NPS_WEIGHTS = [2, 1, 1, 2, 2, 4, 5, 9, 14, 16, 14]
+
+
+def make_survey(rng, index):
+    """Build one survey from a template"""
+    name, description, questions = SURVEY_TEMPLATES[index % len(SURVEY_TEMPLATES)]
+    product = rng.choice(PRODUCTS)
+    built = []
+    for spec in questions:
+        qtype, headline = spec[0], spec[1].format(product=product)
+        question = {'type': qtype, 'headline': headline, 'required': qtype != 'openText'}
+        if qtype in ('multipleChoiceSingle', 'multipleChoiceMulti'):
+            options = CHOICES[spec[2]]
+            question['choices'] = rng.sample(options, rng.randint(3, len(options)))
+        elif qtype == 'rating':
+            question['range'] = rng.choice(RATING_RANGES)
+        elif qtype == 'cta':
+            question['buttonLabel'] = 'Yes, please'
+            question['dismissButtonLabel'] = 'Not now'
+        built.append(question)
+    return {
+        'key': f"survey-{index}",
+        'name': f"{name}: {product} #{index + 1}",
+        'type': rng.choice(['link', 'link', 'app', 'website']),
+        'description': description.format(product=product),
+        'questions': built
+    }
+
+
+def make_user(rng, index, owners=0.2):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        'name': f"{first} {last}",
+        'email': f"{first.lower()}.{last.lower()}.{index}@{COMPANY_DOMAIN}",
+        'role': 'Owner' if rng.random() < owners else 'Manager'
+    }
+
+
+def _answer_sampler(question):
+    """Return a function drawing one valid answer for `question` from an RNG"""
+    qtype = question['type']
+    if qtype == 'nps':
+        values, cum = list(range(11)), list(accumulate(NPS_WEIGHTS))
+        return lambda rng: rng.choices(values, cum_weights=cum)[0]
+    if qtype == 'rating':
+        top = question.get('range', 5)
+        values = list(range(1, top + 1))
+        cum = list(accumulate(i + 1 for i in range(top)))
+        return lambda rng: rng.choices(values, cum_weights=cum)[0]
+    if qtype == 'multipleChoiceSingle':
+        choices = question['choices']
+        return lambda rng: rng.choice(choices)
+    if qtype == 'multipleChoiceMulti':
+        choices = question['choices']
+        return lambda rng: rng.sample(choices, rng.randint(1, len(choices)))
+    if qtype == 'cta':
+        return lambda rng: 'clicked' if rng.random() < 0.35 else 'dismissed'
+    return lambda rng: ' '.join(rng.sample(OPEN_TEXT_CORPUS, rng.randint(1, 3)))
+
+
+def make_responses(rng, survey, count):
+    """Yield `count` response records for one survey"""
+    samplers = [_answer_sampler(q) for q in survey['questions']]
+    for _ in range(count):
+        yield {
+            'kind': 'response',
+            'survey_key': survey['key'],
+            'survey_name': survey['name'],
+            'responses': [{'value': sample(rng)} for sample in samplers]
+        }
+
+
+def plan_shards(surveys, users, shard_size=100):
+    """Split a dataset into shards of at most `shard_size` surveys.
+
+    Users are spread evenly across the same shards. The plan depends only on
+    the dataset size, never on how many workers produce it, so every shard
+    and therefore the merged output is the same for any worker count.
+    Returns (shard, survey_start, survey_end, user_start, user_end) tuples.
+    """
+    count = max(1, -(-surveys // max(1, shard_size)))
+    plan = []
+    for shard in range(count):
+        plan.append((shard,
+                     surveys * shard // count, surveys * (shard + 1) // count,
+                     users * shard // count, users * (shard + 1) // count))
+    return plan
+
+
+def shard_records(seed, shard, survey_start, survey_end, user_start, user_end,
+                  responses_per_survey=1, sampler='numpy', distributions=None):
+    """Yield the records of one shard, seeded from (seed, shard) alone"""
+    rng = random.Random(f"{seed}:{shard}")
+    for index in range(user_start, user_end):
+        yield dict(make_user(rng, index), kind='user')
+    for index in range(survey_start, survey_end):
+        survey = make_survey(rng, index)
+        yield dict(survey, kind='survey')
+        if sampler == 'numpy':
+            from core.sampler import ResponseSampler
+
+            vectorized = ResponseSampler(survey, distributions, seed=[seed, index])
+            yield from vectorized.chunks(responses_per_survey)
+        else:
+            yield from make_responses(rng, survey, responses_per_survey)
+
+
+def synthetic_records(seed=42, surveys=5, users=10, responses_per_survey=1, sampler='numpy',
+                      distributions=None, shard_size=100):
+    """Yield a reproducible stream of survey, user and response records.
+
+    With the numpy sampler, responses arrive as EncodedRecords chunks drawn
+    by core.sampler; the python sampler yields one plain record per response.
+    The stream is the concatenation of plan_shards() shards, in order.
+    """
+    for shard in plan_shards(surveys, users, shard_size):
+        yield from shard_records(seed, *shard, responses_per_survey=responses_per_survey,
+                                 sampler=sampler, distributions=distributions)
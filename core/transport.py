@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Pooled keep-alive HTTP transport shared by every Formbricks API call"""
+import gzip
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core import metrics
+from core.encoding import encode_json
+from core.retry import IDEMPOTENCY_HEADER, classify_http, request_unsent
+
+# Bodies smaller than this are cheaper to send as-is than to compress
+GZIP_MIN_BYTES = 1024
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+class Transport:
+    """One pooled requests.Session for Management, Client and health calls.
+
+    `pool_size` should match the seeding concurrency so every worker thread
+    can hold its own keep-alive connection without waiting on the pool.
+    With a `retry_policy`, transient failures are retried inside request().
+    """
+
+    def __init__(self, base_url, api_key=None, pool_size=8, rate_limiter=None,
+                 compress=False, timeout=30, retry_policy=None):
+        self.base_url = base_url.rstrip('/')
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.compress = compress
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        if api_key:
+            self.session.headers['x-api-key'] = api_key
+
+    def request(self, method, path, json_body=None, body=None, auth=True, timeout=None,
+                idempotency_key=None):
+        """Send a request and return the response, without raising on HTTP errors.
+
+        `body` is an already-encoded JSON payload; otherwise `json_body` is encoded.
+        POSTs are only retried when the request provably never reached the
+        server (connect timeouts, refused connections, 429). An
+        `idempotency_key` is sent unchanged with every attempt, but nothing
+        relies on the server honouring it.
+        """
+        headers = {}
+        if not auth:
+            # A None value drops the session-level header for this request only
+            headers['x-api-key'] = None
+        if idempotency_key:
+            headers[IDEMPOTENCY_HEADER] = idempotency_key
+
+        data = body
+        if data is None and json_body is not None:
+            data = encode_json(json_body)
+        if data is not None:
+            if self.compress and len(data) >= GZIP_MIN_BYTES:
+                data = gzip.compress(data, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
+
+        policy = self.retry_policy
+        if policy is None:
+            try:
+                return self._send(method, path, data, headers, timeout)
+            except requests.exceptions.RequestException as e:
+                e.unsent = request_unsent(e)
+                raise
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response, error = self._send(method, path, data, headers, timeout), None
+            except requests.exceptions.RequestException as e:
+                response, error = None, e
+            retryable, server_delay = classify_http(response, error, idempotent)
+            wait = policy.next_delay(attempt, retryable, server_delay)
+            if wait is None:
+                if error is not None:
+                    error.unsent = request_unsent(error)
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            policy.sleep(wait)
+            attempt += 1
+
+    def _send(self, method, path, data, headers, timeout):
+        """One attempt: pace, send and feed the outcome back to the rate limiter"""
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire()
+            if waited:
+                metrics.observe('sleep', waited, reason='rate_limit')
+        start = time.monotonic()
+        try:
+            response = self.session.request(method, self.base_url + path, data=data, headers=headers,
+                                            timeout=timeout or self.timeout)
+        except requests.exceptions.RequestException as e:
+            latency = time.monotonic() - start
+            metrics.observe('http_request', latency, method=method)
+            metrics.count('http_error', error=type(e).__name__)
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(None, latency)
+            raise
+        latency = time.monotonic() - start
+        metrics.observe('http_request', latency, method=method)
+        metrics.count('http_response', status=response.status_code)
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(response.status_code, latency)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, json_body=None, **kwargs):
+        return self.request('POST', path, json_body=json_body, **kwargs)
+
+    def put(self, path, json_body=None, **kwargs):
+        return self.request('PUT', path, json_body=json_body, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request('DELETE', path, **kwargs)
+
+    def close(self):
+        self.session.close()
@@ -2,10 +2,181 @@
 """Formbricks Challenge - Main CLI Entry Point"""
 import sys
 import argparse
-from commands.up import up_command
-from commands.down import down_command
-from commands.generate import generate_command
-from commands.seed import seed_command
+import importlib
+
+from core import metrics
+
+
+def add_generate_arguments(parser):
+    """Arguments shared by every command that generates data"""
+    parser.add_argument('--provider', default='openai', choices=['openai', 'ollama', 'synthetic'],
+                        help='LLM provider to use, or the offline synthetic engine')
+    parser.add_argument('--model', default='gpt-4o-mini',
+                        help='LLM model to use')
+    parser.add_argument('--output', default='data/generated_data.jsonl',
+                        help='Output file (.jsonl, .jsonl.gz or .jsonl.zst)')
+    parser.add_argument('--llm-concurrency', type=int, default=4,
+                        help='Number of LLM calls to run in parallel')
+    parser.add_argument('--llm-rpm', type=int, default=None,
+                        help='LLM requests per minute (default depends on provider, 0 = unlimited)')
+    parser.add_argument('--llm-token-budget', type=int, default=0,
+                        help='Stop issuing LLM calls after this many tokens (0 = unlimited)')
+    parser.add_argument('--llm-retries', type=int, default=4,
+                        help='Attempts per LLM call on timeouts, 429s and 5xx errors')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always call the LLM and do not store results')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached LLM results and overwrite them with fresh ones')
+    parser.add_argument('--cache-path', default='.cache/llm_cache.sqlite',
+                        help='On-disk LLM result cache')
+    synthetic = parser.add_argument_group('synthetic provider')
+    synthetic.add_argument('--seed', type=int, default=42,
+                           help='Random seed; the same seed always produces the same data')
+    synthetic.add_argument('--surveys', type=int, default=5,
+                           help='Number of surveys to generate')
+    synthetic.add_argument('--users', type=int, default=10,
+                           help='Number of users to generate')
+    synthetic.add_argument('--responses-per-survey', type=int, default=1,
+                           help='Number of responses to generate for each survey')
+    synthetic.add_argument('--sampler', default='numpy', choices=['numpy', 'python'],
+                           help='Draw responses with the vectorized NumPy sampler or pure Python')
+    synthetic.add_argument('--distributions',
+                           help='JSON file overriding the answer distributions of the NumPy sampler')
+    synthetic.add_argument('--shard-size', type=int, default=100,
+                           help='Surveys per shard; output is identical for any --workers')
+
+
+def add_seed_arguments(parser):
+    """Arguments shared by every command that seeds data"""
+    parser.add_argument('--config', default='config.json',
+                        help='Configuration file path')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Number of API requests to run in parallel')
+    parser.add_argument('--rate', type=float, default=20.0,
+                        help='Starting request rate per second (0 disables rate limiting)')
+    parser.add_argument('--max-rate', type=float, default=500.0,
+                        help='Upper bound for the adaptive request rate')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Gzip-compress large request bodies')
+    parser.add_argument('--batch-size', type=int, default=50,
+                        help='Responses per survey sent together by one worker')
+    parser.add_argument('--journal', default='data/seed_journal.jsonl',
+                        help='Progress journal recording everything created')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip work already recorded in the journal')
+    parser.add_argument('--registry', default='data/survey_registry.json',
+                        help='Where to save the survey key -> Formbricks ID index')
+    parser.add_argument('--retries', type=int, default=4,
+                        help='Attempts per API request on timeouts, 429s and 5xx errors')
+    parser.add_argument('--retry-budget', type=int, default=1000,
+                        help='Maximum retries across the whole run (0 = unlimited)')
+    parser.add_argument('--delta', action='store_true',
+                        help='Only create new surveys and update ones whose data changed since '
+                             'they were seeded (edits made on the server are not detected)')
+    parser.add_argument('--engine', choices=['threads', 'async'], default='threads',
+                        help='Worker threads, or one asyncio event loop (requires aiohttp) '
+                             'for concurrency in the thousands')
+
+
+def common_arguments():
+    """Options accepted by every formbricks subcommand"""
+    parser = argparse.ArgumentParser(add_help=False)
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--metrics', action='store_true',
+                       help='Time each stage and print a summary table when the command ends')
+    group.add_argument('--metrics-file',
+                       help='Also write the metrics to this file (implies --metrics)')
+    group.add_argument('--metrics-format', default='prometheus', choices=['prometheus', 'openmetrics'],
+                       help='Text format used for --metrics-file')
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', nargs='?', const='cprofile', choices=['cprofile', 'sample'],
+                       help='Profile the command: cprofile (main thread, writes .prof) or sample '
+                            '(every thread, writes collapsed stacks for flamegraphs)')
+    group.add_argument('--profile-output',
+                       help='Path prefix for profiling output (default: profiles/<command>-<time>)')
+    group.add_argument('--profile-interval', type=float,
+                       help='Seconds between stack samples for --profile sample (default: 0.005)')
+    group.add_argument('--tracemalloc', action='store_true',
+                       help='Track allocations and report the largest allocation sites')
+    return parser
+
+
+def generation_options(args):
+    from core.sampler import load_distributions
+
+    return dict(llm_concurrency=args.llm_concurrency, rpm=args.llm_rpm,
+                token_budget=args.llm_token_budget, llm_retries=args.llm_retries,
+                use_cache=not args.no_cache, refresh=args.refresh, cache_path=args.cache_path,
+                synthetic=dict(seed=args.seed, surveys=args.surveys, users=args.users,
+                               responses_per_survey=args.responses_per_survey,
+                               sampler=args.sampler,
+                               distributions=load_distributions(args.distributions),
+                               shard_size=args.shard_size))
+
+
+def seed_options(args):
+    return dict(concurrency=args.concurrency, rate=args.rate, max_rate=args.max_rate,
+                compress=args.gzip, batch_size=args.batch_size,
+                journal_path=args.journal, resume=args.resume, registry_path=args.registry,
+                retries=args.retries, retry_budget=args.retry_budget, engine=args.engine,
+                delta=args.delta)
+
+
+def report_metrics(args):
+    print("\nMetrics:")
+    print(metrics.summary())
+    if args.metrics_file:
+        metrics.write(args.metrics_file, openmetrics=args.metrics_format == 'openmetrics')
+        print(f"Metrics written to {args.metrics_file}")
+
+
+def generate_kwargs(args):
+    return dict(provider=args.provider, model=args.model, output=args.output, workers=args.workers,
+                **generation_options(args))
+
+
+def seed_kwargs(args):
+    return dict(config_path=args.config, data_file=args.data_file, **seed_options(args))
+
+
+def purge_kwargs(args):
+    return dict(config_path=args.config, registry_path=args.registry, journal_path=args.journal,
+                discover=args.discover, concurrency=args.concurrency, rate=args.rate,
+                retries=args.retries, dry_run=args.dry_run)
+
+
+def pipeline_kwargs(args):
+    return dict(config_path=args.config, provider=args.provider, model=args.model,
+                output=args.output, queue_size=args.queue_size,
+                generation_options=generation_options(args), **seed_options(args))
+
+
+# Command name -> (module, function, keyword arguments from the parsed args).
+# Modules are imported only when their command runs, so `down` and --help
+# never pay for requests, numpy or the OpenAI SDK.
+COMMANDS = {
+    'up': ('commands.up', 'up_command', lambda args: {}),
+    'down': ('commands.down', 'down_command', lambda args: {}),
+    'generate': ('commands.generate', 'generate_command', generate_kwargs),
+    'seed': ('commands.seed', 'seed_command', seed_kwargs),
+    'pipeline': ('commands.pipeline', 'pipeline_command', pipeline_kwargs),
+    'purge': ('commands.purge', 'purge_command', purge_kwargs),
+}
+
+
+def load_command(name):
+    """Import and return the function implementing command `name`"""
+    module_name, function_name, _ = COMMANDS[name]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def run(args, parser, formbricks_parser):
+    if args.service != 'formbricks':
+        parser.print_help()
+    elif args.command in COMMANDS:
+        load_command(args.command)(**COMMANDS[args.command][2](args))
+    else:
+        formbricks_parser.print_help()
 
 
 def main():
@@ -19,40 +190,74 @@ def main():
     # Formbricks subcommand
     formbricks_parser = subparsers.add_parser('formbricks', help='Manage Formbricks')
     formbricks_subparsers = formbricks_parser.add_subparsers(dest='command', help='Command')
+    common = common_arguments()
 
     # Up command
-    formbricks_subparsers.add_parser('up', help='Start Formbricks locally')
+    formbricks_subparsers.add_parser('up', help='Start Formbricks locally', parents=[common])
 
     # Down command
-    formbricks_subparsers.add_parser('down', help='Stop Formbricks and clean up')
+    formbricks_subparsers.add_parser('down', help='Stop Formbricks and clean up', parents=[common])
 
     # Generate command
-    generate_parser = formbricks_subparsers.add_parser('generate', help='Generate test data using LLM')
-    generate_parser.add_argument('--provider', default='openai', choices=['openai', 'ollama'],
-                                help='LLM provider to use')
-    generate_parser.add_argument('--model', default='gpt-4o-mini',
-                                help='LLM model to use')
+    generate_parser = formbricks_subparsers.add_parser('generate', help='Generate test data using LLM',
+                                                       parents=[common])
+    add_generate_arguments(generate_parser)
+    generate_parser.add_argument('--workers', type=int, default=1,
+                                 help='Processes generating synthetic shards in parallel')
 
     # Seed command
-    seed_parser = formbricks_subparsers.add_parser('seed', help='Seed Formbricks with generated data')
-    seed_parser.add_argument('--config', default='config.json',
-                            help='Configuration file path')
+    seed_parser = formbricks_subparsers.add_parser('seed', help='Seed Formbricks with generated data',
+                                                   parents=[common])
+    add_seed_arguments(seed_parser)
+    seed_parser.add_argument('--data-file', default='data/generated_data.jsonl',
+                            help='Generated data file to seed from')
+
+    # Pipeline command
+    pipeline_parser = formbricks_subparsers.add_parser(
+        'pipeline', help='Generate data and seed it while it is being generated', parents=[common])
+    add_generate_arguments(pipeline_parser)
+    add_seed_arguments(pipeline_parser)
+    pipeline_parser.add_argument('--queue-size', type=int, default=1000,
+                                 help='Generated records buffered ahead of the seeder')
+
+    # Purge command
+    purge_parser = formbricks_subparsers.add_parser(
+        'purge', help='Delete seeded surveys and responses, keeping the stack running',
+        parents=[common])
+    purge_parser.add_argument('--config', default='config.json',
+                              help='Configuration file path')
+    purge_parser.add_argument('--registry', default='data/survey_registry.json',
+                              help='Survey index written by seed')
+    purge_parser.add_argument('--journal', default='data/seed_journal.jsonl',
+                              help='Progress journal written by seed')
+    purge_parser.add_argument('--discover', action='store_true',
+                              help='Also delete every survey on the server tagged as seeded')
+    purge_parser.add_argument('--concurrency', type=int, default=16,
+                              help='Number of surveys to delete in parallel')
+    purge_parser.add_argument('--rate', type=float, default=0.0,
+                              help='Initial requests/second (0 = unlimited)')
+    purge_parser.add_argument('--retries', type=int, default=4,
+                              help='Attempts per request on timeouts, 429s and 5xx errors')
+    purge_parser.add_argument('--dry-run', action='store_true',
+                              help='List the surveys that would be deleted and stop')
 
     args = parser.parse_args()
 
-    if args.service == 'formbricks':
-        if args.command == 'up':
-            up_command()
-        elif args.command == 'down':
-            down_command()
-        elif args.command == 'generate':
-            generate_command(provider=args.provider, model=args.model)
-        elif args.command == 'seed':
-            seed_command(config_path=args.config)
+    if getattr(args, 'metrics', False) or getattr(args, 'metrics_file', None):
+        metrics.enable()
+    try:
+        if getattr(args, 'profile', None) or getattr(args, 'tracemalloc', False):
+            from core import profiling
+
+            prefix = args.profile_output or profiling.default_prefix(args.command)
+            with profiling.profiled(args.profile, prefix, trace_allocations=args.tracemalloc,
+                                    interval=args.profile_interval):
+                run(args, parser, formbricks_parser)
         else:
-            formbricks_parser.print_help()
-    else:
-        parser.print_help()
+            run(args, parser, formbricks_parser)
+    finally:
+        if metrics.enabled():
+            report_metrics(args)
 
 
 if __name__ == '__main__':